@@ -1,26 +1,25 @@
 # pyright: reportMissingImports=false
 
-import csv
 import ctypes
 import logging
+import numpy
 import os
-import pyarrow as pa
-import pyarrow.parquet as pq
-import re
+import sys
 import threading
+import time
 
 # from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import IntEnum
+from functools import cached_property
 
 from pymhf import FUNCDEF
 from pymhf.core import _internal as pymhf_internal
 from pymhf.core.memutils import map_struct
 from pymhf.core.mod_loader import ModState
-from pymhf.core.utils import safe_assign_enum
 from pymhf.extensions.cpptypes import std
-from pymhf.gui import BOOLEAN, STRING, gui_button
+from pymhf.gui import BOOLEAN, INTEGER, STRING, gui_button
 
 from nmspy import NMSMod
 from nmspy.data import (
@@ -29,7 +28,46 @@ from nmspy.data import (
     structs as nms_structs,
 )
 from nmspy.data.functions import call_sigs, hooks, patterns
-from nmspy.decorators import on_fully_booted
+from nmspy.decorators import main_loop, on_fully_booted
+
+sys.path.append(os.path.realpath(os.path.join(os.path.dirname(__file__), "..")))  # code shared with the offline tools is in the Pi root directory
+
+from pi_engine import (
+    ITEM_ORDERS,
+    LANGUAGES,
+    PI_ROOT,
+    PIPELINE_BATCH_SIZE,
+    RE_PRODUCT_AGE,
+    STATS_BONUS_DTYPE,
+    TOTAL_SEEDS,
+    Backend,
+    Checkpoint,
+    CostModel,
+    FrameScheduler,
+    ItemJob,
+    ItemUnavailableError,
+    JobManager,
+    PhaseTimer,
+    Pipeline,
+    ProductBuilder,
+    ProductCache,
+    RunProfiler,
+    RunHistory,
+    RunReport,
+    SeedKey,
+    StorageProfile,
+    TechnologyBuilder,
+    TechnologyCache,
+    cache_path,
+    get_storage,
+    item_path,
+    package_version,
+    process_memory,
+    select_products,
+    select_technologies,
+    stat_names_array,
+    write_names,
+)
 
 
 # region NMS.py
@@ -37,8 +75,9 @@ from nmspy.decorators import on_fully_booted
 # region Class
 
 
+# values of eStatsType. only the one of the running version is turned into an IntEnum, see VersionProfile
 # size is one more than the last value
-class eStatsType_413(IntEnum):
+class eStatsType_413:
     Unspecified = 0x0
     Weapon_Laser = 0x1
     Weapon_Laser_Damage = 0x2
@@ -230,7 +269,7 @@ class eStatsType_413(IntEnum):
     Vehicle_AutoPilot = 0xBC
 
 
-class eStatsType_520(IntEnum):
+class eStatsType_520:
     Unspecified = 0x0
     Weapon_Laser = 0x1
     Weapon_Laser_Damage = 0x2
@@ -432,7 +471,7 @@ class eStatsType_520(IntEnum):
     Vehicle_FlameHeatTime = 0xC6
 
 
-class eStatsType_561(IntEnum):
+class eStatsType_561:
     Unspecified = 0x0
     Weapon_Laser = 0x1
     Weapon_Laser_Damage = 0x2
@@ -556,7 +595,7 @@ class eStatsType_561(IntEnum):
     Ship_Weapons_Guns_Rate = 0x78
     Ship_Weapons_Guns_HeatTime = 0x79
     Ship_Weapons_Guns_CoolTime = 0x7A
-    Ship_Weapons_Guns_Scale = 0x78B
+    Ship_Weapons_Guns_Scale = 0x7B
     Ship_Weapons_Guns_BulletsPerShot = 0x7C
     Ship_Weapons_Guns_Dispersion = 0x7D
     Ship_Weapons_Guns_Range = 0x7E
@@ -688,9 +727,9 @@ STRUCTS_FIELDS_OFFSETS_TECHNOLOGY_413 = [("NameLower", 0x0B0), ("StatBonuses", 0
 STRUCTS_FIELDS_OFFSETS_TECHNOLOGY_520 = [("NameLower", 0x244), ("StatBonuses", 0x158)]
 
 
-def _class_fields(cls, structs_fields_offsets):
+def _class_fields(cls, structs_fields_offsets: list[tuple[str, int]]):
     if not hasattr(cls, "_fields_"):
-        cls._fields_ = _generate_fields(structs_fields_offsets[_binary_hash_index()])
+        cls._fields_ = _generate_fields(structs_fields_offsets)
 
 
 def _generate_fields(structs_fields_offsets: list[tuple[str, int]]):
@@ -714,6 +753,23 @@ def _generate_fields(structs_fields_offsets: list[tuple[str, int]]):
     return result
 
 
+# structured dtype to view an array of the class in NumPy without copying it. fields must be in the same order as in dtype
+def _class_dtype(cls, structs_fields_offsets: list[tuple[str, int]], dtype: numpy.dtype) -> numpy.dtype:
+    offsets = dict(structs_fields_offsets)
+    return numpy.dtype({
+        "names": dtype.names,
+        "formats": [dtype.fields[name][0] for name in dtype.names],
+        "offsets": [offsets[name] for name in dtype.names],
+        "itemsize": ctypes.sizeof(cls),
+    })
+
+
+# read one field of the class at an address without mapping the entire class, the offset is resolved only once
+def _field_reader(cls, name: str):
+    struct, offset = STRUCTS_FIELDS[name][0], getattr(cls, name).offset
+    return lambda address: struct.from_address(address + offset)
+
+
 # endregion
 
 # region Call Signatures
@@ -721,11 +777,6 @@ def _generate_fields(structs_fields_offsets: list[tuple[str, int]]):
 FUNCDEFS_LANGUAGEMANAGERBASE_LOAD_413 = FUNCDEF(restype=None, argtypes=[ctypes.c_ulonglong                                   ])
 FUNCDEFS_LANGUAGEMANAGERBASE_LOAD_520 = FUNCDEF(restype=None, argtypes=[ctypes.c_ulonglong, ctypes.c_ulonglong, ctypes.c_char])
 
-
-def _call_sigs(key, func_call_sigs):
-    call_sigs.FUNC_CALL_SIGS[key] = func_call_sigs[_binary_hash_index()]
-
-
 # endregion
 
 # region Patterns
@@ -747,308 +798,114 @@ PATTERNS_REALITYMANAGER_GENERATEPROCEDURALPRODUCT_520 = "48 89 54 24 10 48 89 4C
 PATTERNS_REALITYMANAGER_GENERATEPROCEDURALTECHNOLOGY_413 = "44 88 44 24 18 48 89 4C 24 08 55 56 41"
 PATTERNS_REALITYMANAGER_GENERATEPROCEDURALTECHNOLOGY_520 = "44 88 44 24 18 48 89 4C 24 08 55 41"
 
-
-def _patterns(key, func_patterns):
-    patterns.FUNC_PATTERNS[key] = func_patterns[_binary_hash_index()]
-
-
 # endregion
 
-
-def _binary_hash_index() -> int:
-    # get the index of current hash
-    return list(KNOWN_BINARY_HASH.keys()).index(pymhf_internal.BINARY_HASH)
+# region Version Profile
 
 
-KNOWN_BINARY_HASH = {
-    "014f5fd1837e2bd8356669b92109fd3add116137": "4.13",  # (GOG.dev)
-    "239fac0224333873c733c4e5b4d9694ea6cc0b41": "5.20",  # (GOG.com)
-    "0969a2aa4e7c025bf99d6e9a807da85a9110fbc2": "5.61",  # (GOG.com)
+# everything that differs between the supported game versions
+@dataclass
+class VersionProfile:
+    version: str
+    stats_type: type  # class with the values of eStatsType
+    structs_fields_offsets: dict[type, list[tuple[str, int]]]
+    call_sigs: dict[str, FUNCDEF]
+    patterns: dict[str, str]
+
+    # register everything needed before the hooks are set up
+    def setup(self):
+        for cls, structs_fields_offsets in self.structs_fields_offsets.items():
+            _class_fields(cls, structs_fields_offsets)
+
+        call_sigs.FUNC_CALL_SIGS.update(self.call_sigs)
+        patterns.FUNC_PATTERNS.update(self.patterns)
+
+    @cached_property
+    def eStatsType(self) -> type[IntEnum]:
+        return IntEnum("eStatsType", {name: value for name, value in vars(self.stats_type).items() if not name.startswith("_")})
+
+    @cached_property
+    def stat_names(self) -> numpy.ndarray:
+        return stat_names_array({int(stat): stat.name for stat in self.eStatsType})
+
+    @cached_property
+    def stats_bonus_dtype(self) -> numpy.dtype:
+        return _class_dtype(cGcStatsBonus, self.structs_fields_offsets[cGcStatsBonus], STATS_BONUS_DTYPE)
+
+
+# to support a new version, add its hash with the offsets, call signatures, and patterns that have changed
+KNOWN_VERSION_PROFILES = {
+    "014f5fd1837e2bd8356669b92109fd3add116137": VersionProfile(  # (GOG.dev)
+        version="4.13",
+        stats_type=eStatsType_413,
+        structs_fields_offsets={
+            cGcProductData: STRUCTS_FIELDS_OFFSETS_PRODUCTDATA_413,
+            cGcRealityManager: STRUCTS_FIELDS_OFFSETS_REALITYMANAGER_413,
+            cGcStatsBonus: STRUCTS_FIELDS_OFFSETS_STATSBONUS_413,
+            cGcTechnology: STRUCTS_FIELDS_OFFSETS_TECHNOLOGY_413,
+        },
+        call_sigs={
+            "cTkLanguageManagerBase::Load": FUNCDEFS_LANGUAGEMANAGERBASE_LOAD_413,
+        },
+        patterns={
+            "cTkLanguageManagerBase::Load": PATTERNS_LANGUAGEMANAGERBASE_LOAD_413,  # offset="0x24D5E90"
+            "cGcRealityManager::Construct": PATTERNS_REALITYMANAGER_CONSTRUCT_413,  # offset="0x0BC5AF0"
+            "cGcRealityManager::GenerateProceduralProduct": PATTERNS_REALITYMANAGER_GENERATEPROCEDURALPRODUCT_413,  # offset="0x0BCEAE0"
+            "cGcRealityManager::GenerateProceduralTechnology": PATTERNS_REALITYMANAGER_GENERATEPROCEDURALTECHNOLOGY_413,  # offset="0x0BD1E00"
+        },
+    ),
+    "239fac0224333873c733c4e5b4d9694ea6cc0b41": VersionProfile(  # (GOG.com)
+        version="5.20",
+        stats_type=eStatsType_520,
+        structs_fields_offsets={
+            cGcProductData: STRUCTS_FIELDS_OFFSETS_PRODUCTDATA_520,
+            cGcRealityManager: STRUCTS_FIELDS_OFFSETS_REALITYMANAGER_520,
+            cGcStatsBonus: STRUCTS_FIELDS_OFFSETS_STATSBONUS_520,
+            cGcTechnology: STRUCTS_FIELDS_OFFSETS_TECHNOLOGY_520,
+        },
+        call_sigs={
+            "cTkLanguageManagerBase::Load": FUNCDEFS_LANGUAGEMANAGERBASE_LOAD_520,
+        },
+        patterns={
+            "cTkLanguageManagerBase::Load": PATTERNS_LANGUAGEMANAGERBASE_LOAD_520,  # offset="0x23653E0"
+            "cGcRealityManager::Construct": PATTERNS_REALITYMANAGER_CONSTRUCT_520,  # offset="0x0D14080"
+            "cGcRealityManager::GenerateProceduralProduct": PATTERNS_REALITYMANAGER_GENERATEPROCEDURALPRODUCT_520,  # offset="0x0D218B0"
+            "cGcRealityManager::GenerateProceduralTechnology": PATTERNS_REALITYMANAGER_GENERATEPROCEDURALTECHNOLOGY_520,  # offset="0x0D24F40"
+        },
+    ),
+    "0969a2aa4e7c025bf99d6e9a807da85a9110fbc2": VersionProfile(  # (GOG.com)
+        version="5.61",
+        stats_type=eStatsType_561,
+        structs_fields_offsets={
+            cGcProductData: STRUCTS_FIELDS_OFFSETS_PRODUCTDATA_561,
+            cGcRealityManager: STRUCTS_FIELDS_OFFSETS_REALITYMANAGER_561,
+            cGcStatsBonus: STRUCTS_FIELDS_OFFSETS_STATSBONUS_520,
+            cGcTechnology: STRUCTS_FIELDS_OFFSETS_TECHNOLOGY_520,
+        },
+        call_sigs={
+            "cTkLanguageManagerBase::Load": FUNCDEFS_LANGUAGEMANAGERBASE_LOAD_520,
+        },
+        patterns={
+            "cTkLanguageManagerBase::Load": PATTERNS_LANGUAGEMANAGERBASE_LOAD_520,  # offset="0x262C940"
+            "cGcRealityManager::Construct": PATTERNS_REALITYMANAGER_CONSTRUCT_561,  # offset="0x0D61800"
+            "cGcRealityManager::GenerateProceduralProduct": PATTERNS_REALITYMANAGER_GENERATEPROCEDURALPRODUCT_520,  # offset="0x0D6F0B0"
+            "cGcRealityManager::GenerateProceduralTechnology": PATTERNS_REALITYMANAGER_GENERATEPROCEDURALTECHNOLOGY_520,  # offset="0x0D72AD0"
+        },
+    ),
 }
-if pymhf_internal.BINARY_HASH in KNOWN_BINARY_HASH:
-    _class_fields(cGcProductData, [
-        STRUCTS_FIELDS_OFFSETS_PRODUCTDATA_413,
-        STRUCTS_FIELDS_OFFSETS_PRODUCTDATA_520,
-        STRUCTS_FIELDS_OFFSETS_PRODUCTDATA_561,
-    ])
-    _class_fields(cGcRealityManager, [
-        STRUCTS_FIELDS_OFFSETS_REALITYMANAGER_413,
-        STRUCTS_FIELDS_OFFSETS_REALITYMANAGER_520,
-        STRUCTS_FIELDS_OFFSETS_REALITYMANAGER_561,
-    ])
-    _class_fields(cGcStatsBonus, [
-        STRUCTS_FIELDS_OFFSETS_STATSBONUS_413,
-        STRUCTS_FIELDS_OFFSETS_STATSBONUS_520,
-        STRUCTS_FIELDS_OFFSETS_STATSBONUS_520,
-    ])
-    _class_fields(cGcTechnology, [
-        STRUCTS_FIELDS_OFFSETS_TECHNOLOGY_413,
-        STRUCTS_FIELDS_OFFSETS_TECHNOLOGY_520,
-        STRUCTS_FIELDS_OFFSETS_TECHNOLOGY_520,
-    ])
-
-    _call_sigs("cTkLanguageManagerBase::Load", [
-        FUNCDEFS_LANGUAGEMANAGERBASE_LOAD_413,
-        FUNCDEFS_LANGUAGEMANAGERBASE_LOAD_520,
-        FUNCDEFS_LANGUAGEMANAGERBASE_LOAD_520,
-    ])
-
-    _patterns("cTkLanguageManagerBase::Load", [
-        PATTERNS_LANGUAGEMANAGERBASE_LOAD_413,  # 4.13 (offset="0x24D5E90")
-        PATTERNS_LANGUAGEMANAGERBASE_LOAD_520,  # 5.20 (offset="0x23653E0")
-        PATTERNS_LANGUAGEMANAGERBASE_LOAD_520,  # 5.61 (offset="0x262C940")
-    ])
-    _patterns("cGcRealityManager::Construct", [
-        PATTERNS_REALITYMANAGER_CONSTRUCT_413,  # 4.13 (offset="0x0BC5AF0")
-        PATTERNS_REALITYMANAGER_CONSTRUCT_520,  # 5.20 (offset="0x0D14080")
-        PATTERNS_REALITYMANAGER_CONSTRUCT_561,  # 5.61 (offset="0x0D61800")
-    ])
-    _patterns("cGcRealityManager::GenerateProceduralProduct", [
-        PATTERNS_REALITYMANAGER_GENERATEPROCEDURALPRODUCT_413,  # 4.13 (offset="0x0BCEAE0")
-        PATTERNS_REALITYMANAGER_GENERATEPROCEDURALPRODUCT_520,  # 5.20 (offset="0x0D218B0")
-        PATTERNS_REALITYMANAGER_GENERATEPROCEDURALPRODUCT_520,  # 5.61 (offset="0x0D6F0B0")
-    ])
-    _patterns("cGcRealityManager::GenerateProceduralTechnology", [
-        PATTERNS_REALITYMANAGER_GENERATEPROCEDURALTECHNOLOGY_413,  # 4.13 (offset="0x0BD1E00")
-        PATTERNS_REALITYMANAGER_GENERATEPROCEDURALTECHNOLOGY_520,  # 5.20 (offset="0x0D24F40")
-        PATTERNS_REALITYMANAGER_GENERATEPROCEDURALTECHNOLOGY_520,  # 5.61 (offset="0x0D72AD0")
-    ])
-
-    enums = [
-        eStatsType_413,
-        eStatsType_520,
-        eStatsType_561,
-    ]
-    eStatsType = enums[_binary_hash_index()]
-
-# endregion
-
-
-# region Configuration
-
-FREE_MEMORY_STEPS = 250  # multiple of it should be TOTAL_SEEDS
-
-TOTAL_SEEDS = 100000
-
-TRANSFORM = {
-    # region Weapon
-
-    "Weapon_Laser_Damage": [],  # Damage (+???%) > 70.25779724121094
-    "Weapon_Laser_Mining_Speed": [(1, "-"), ("*", 100)],  # Mining Speed (+16%) > 0.8384891152381897 > 16.15108847618103
-    "Weapon_Laser_HeatTime": [("-", 1), ("*", 100)],  # Heat Dispersion (+41%) > 1.407882571220398 > 40.788257122039795
-    "Weapon_Laser_ReloadTime": [(1, "-"), ("*", 100)],  # Overheat Downtime (-15%) > 0.8482741117477417 > 15.17258882522583
-    "Weapon_Laser_Drain": [("-", 1), ("*", 100)],  # Fuel Efficiency (+20%) > 1.2000000476837158 > 20.000004768371582
-    "Weapon_Laser_ChargeTime": [(1, "-"), ("*", 100)],  # Time to Full Power (-19%) > 0.8105689287185669 > 18.94310712814331
-    "Weapon_Projectile_Damage": [],  # Damage (+???%) > 2.270596981048584
-    "Weapon_Projectile_Rate": [("-", 1), ("*", 100)],  # Fire Rate (+13%) > 1.13314688205719 > 13.314688205718994
-    "Weapon_Projectile_ClipSize": [],  # Clip Size (+12.0) > 12.0
-    "Weapon_Projectile_ReloadTime": [(1, "-"), ("*", 100)],  # Reload Time (-6%) > 0.9432281255722046 > 5.677187442779541
-    "Weapon_Projectile_MaximumCharge": [],  # Ion Spheres Created (+1.0) > 1.0
-    "Weapon_Projectile_BurstCap": [],  # Shots Per Burst (+1.0) > 1.0
-    "Weapon_Projectile_BurstCooldown": [(1, "-"), ("*", 100)],  # Burst Cooldown (-19%) > 0.8145824074745178 > 18.541759252548218
-    "Weapon_ChargedProjectile_ChargeTime": [(1, "-"), ("*", 100)],  # Charging Speed (-10%) > 0.8965481519699097 > 10.345184803009033
-    "Weapon_ChargedProjectile_ExtraSpeed": [],  # Ion Sphere Speed (+22%) > 21.99700164794922
-    "Weapon_Grenade_Damage": [],  # Damage (+???%) > 350.14752197265625 > 350.14752197265625
-    "Weapon_Grenade_Radius": [("-", 1), ("*", 100)],  # Explosion Radius (+41%) > 1.407882571220398 > 40.788257122039795
-    "Weapon_Grenade_Speed": [("*", 100)],  # Projectile Velocity (+272%) > 2.7219414710998535 > 272.19414710998535
-    "Weapon_Grenade_Bounce": [],  # Bounce Potential (+???%) > 3.0
-    "Weapon_Scan_Radius": [("-", 1), ("*", 100)],  # Scan Radius (+33%) > 1.3270596265792847 > 32.70596265792847
-    "Weapon_Scan_Discovery_Creature": [("*", 100)],  # Fauna Analysis Rewards (+6,775%) > 67.75889587402344 > 6775.889587402344
-    "Weapon_Scan_Discovery_Flora": [("*", 100)],  # Flora Analysis Rewards (+7,897%) > 78.97901153564453 > 7897.901153564453
-    "Weapon_Scan_Discovery_Mineral": [("*", 100)],  # Mineral Analysis Rewards (+9,026%) > 90.26795196533203 > 9026.795196533203
-    "Weapon_FireDOT_Duration": [("-", 1), ("*", 100)],  # Impact Fire Duration (+27%) > 1.2693740129470825 > 26.93740129470825
-
-    # endregion
-
-    # region Suit
-
-    "Suit_Armour_Health": [],  # Core Health (+???%) > 20.0
-    "Suit_Armour_Shield_Strength": [("*", 100)],  # Shield Strength (+32%) > 0.3216187655925751 > 32.16187655925751
-    "Suit_Energy": [("*", 100)],  # Life Support Tanks (+108%) > 1.0757951736450195 > 107.57951736450195
-    "Suit_Energy_Regen": [("-", 1), ("*", 100)],  # Solar Panel Power (+73%) > 1.7318912744522095 > 73.18912744522095
-    "Suit_Protection_Cold": [],  # Cold Protection (???) > 334.7082214355469
-    "Suit_Protection_Heat": [],  # Heat Protection (???) > 334.7082214355469
-    "Suit_Protection_Toxic": [],  # Toxic Protection (???) > 334.7082214355469
-    "Suit_Protection_Radiation": [],  # Radiation Protection (???) > 334.7082214355469
-    "Suit_Underwater": [],  # Oxygen Tank (???) > 159.639404296875
-    "Suit_DamageReduce_Cold": [(1, "-"), ("*", 100)],  # Cold Damage Shielding (+19%) > 0.8105689287185669 > 18.94310712814331
-    "Suit_DamageReduce_Heat": [(1, "-"), ("*", 100)],  # Heat Damage Shielding (+19%) > 0.8105689287185669 > 18.94310712814331
-    "Suit_DamageReduce_Radiation": [(1, "-"), ("*", 100)],  # Radiation Damage Shielding (+19%) > 0.8105689287185669 > 18.94310712814331
-    "Suit_DamageReduce_Toxic": [(1, "-"), ("*", 100)],  # Toxic Damage Shielding (+19%) > 0.8105689287185669 > 18.94310712814331
-    "Suit_Protection_HeatDrain": [("-", 1), ("*", 100)],  # Heat Resistance (+7%) > 1.0696643590927124 > 6.96643590927124
-    "Suit_Protection_ColdDrain": [("-", 1), ("*", 100)],  # Cold Resistance (+3%) > 1.0343537330627441 > 3.435373306274414
-    "Suit_Protection_ToxDrain": [("-", 1), ("*", 100)],  # Toxic Resistance (+10%) > 1.0958983898162842 > 9.589838981628418
-    "Suit_Protection_RadDrain": [("-", 1), ("*", 100)],  # Radiation Resistance (+2%) > 1.0243568420410156 > 2.4356842041015625
-    "Suit_Stamina_Strength": [("*", 100)],  # Sprint Distance (+43%) > 0.431468665599823 > 43.1468665599823
-    "Suit_Stamina_Recovery": [("-", 1), ("*", 100)],  # Sprint Recovery Time (+38%) > 1.3798800706863403 > 37.98800706863403
-    "Suit_Jetpack_Tank": [("*", 100)],  # Jetpack Tanks (+203%) > 2.0275888442993164 > 202.75888442993164
-    "Suit_Jetpack_Drain": [(1, "-"), ("*", 100)],  # Fuel Efficiency (+6%) > 0.9411903619766235 > 5.8809638023376465
-    "Suit_Jetpack_Refill": [("-", 1), ("*", 100)],  # Recharge Rate (+15%) > 1.1500355005264282 > 15.003550052642822
-    "Suit_Jetpack_Ignition": [("-", 1), ("*", 100)],  # Initial Boost Power (+8%) > 1.0770596265792847 > 7.705962657928467
-
-    # endregion
 
-    # region Ship
-
-    "Ship_Weapons_Guns_Damage": [],  # Damage (+???%) > 6.0000176429748535
-    "Ship_Weapons_Guns_Rate": [("-", 1), ("*", 100)],  # Fire Rate (+6%) > 1.0602484941482544 > 6.0248494148254395
-    "Ship_Weapons_Guns_HeatTime": [("-", 1), ("*", 100)],  # Heat Dispersion (+6%) > 1.0629289150238037 > 6.292891502380371
-    "Ship_Weapons_Lasers_Damage": [],  # Damage (+???%) > 60.02950668334961
-    "Ship_Weapons_Lasers_HeatTime": [("-", 1), ("*", 100)],  # Heat Dispersion (+89%) > 1.8867706060409546 > 88.67706060409546
-    "Ship_Weapons_ShieldLeech": [],  # Shield recharge on impact (+???%) > 0.27219414710998535
-    "Ship_Armour_Shield_Strength": [],  # Shield Strength (+???%) > 0.20000000298023224
-    "Ship_Hyperdrive_JumpDistance": [],  # Hyperdrive Range (251 ly) > 250.77337646484375
-    "Ship_Hyperdrive_JumpsPerCell": [("*", 100)],  # Warp Cell Efficiency (+100%) > 1.0 > 100.0
-    "Ship_Launcher_TakeOffCost": [(1, "-"), ("*", 100)],  # Launch Cost (-20%) > 0.800000011920929 > 19.999998807907104
-    "Ship_Launcher_AutoCharge": [],  # Automatic Recharging (Enabled) > 1.0
-    "Ship_PulseDrive_MiniJumpFuelSpending": [(1, "-"), ("*", 100)],  # Pulse Drive Fuel Efficiency (+20%) > 0.800000011920929 > 19.999998807907104
-    "Ship_Boost": [("-", 1), ("*", 100)],  # Boost (+14%) > 1.1405895948410034 > 14.058959484100342
-    "Ship_Maneuverability": [],  # Maneuverability (???) > 1.006500005722046
-    "Ship_BoostManeuverability": [("-", 1), ("*", 100)],  # Maneuverability (+10%) > 1.1019220352172852 > 10.192203521728516
+PROFILE = KNOWN_VERSION_PROFILES.get(pymhf_internal.BINARY_HASH)  # None if the executable is unknown
+if PROFILE is not None:
+    PROFILE.setup()
 
-    # endregion
-
-    # region Freighter
-
-    "Freighter_Hyperdrive_JumpDistance": [],  # Hyperdrive Range (230 ly) > 229.639404296875
-    "Freighter_Hyperdrive_JumpsPerCell": [("*", 100)],  # Warp Cell Efficiency (+100%) > 1.0 > 100.0
-    "Freighter_Fleet_Speed": [("-", 1), ("*", 100)],  # Expedition Speed (+15%) > 1.149999976158142 > 14.999997615814209
-    "Freighter_Fleet_Fuel": [(1, "-"), ("*", 100)],  # Expedition Efficiency (+17%) > 0.8277047276496887 > 17.229527235031128
-    "Freighter_Fleet_Combat": [("-", 1), ("*", 100)],  # Expedition Defenses (+15%) > 1.149999976158142 > 14.999997615814209
-    "Freighter_Fleet_Trade": [("-", 1), ("*", 100)],  # Expedition Trade Ability (+15%) > 1.149999976158142 > 14.999997615814209
-    "Freighter_Fleet_Explore": [("-", 1), ("*", 100)],  # Expedition Scientific Ability (+15%) > 1.149999976158142 > 14.999997615814209
-    "Freighter_Fleet_Mine": [("-", 1), ("*", 100)],  # Expedition Mining Ability (+15%) > 1.149999976158142 > 14.999997615814209
+# endregion
 
-    # endregion
+# endregion
 
-    # region Vehicle
 
-    "Vehicle_EngineFuelUse": [(1, "-"), ("*", 100)],  # Fuel Usage (-28%) > 0.7158533930778503 > 28.414660692214966
-    "Vehicle_EngineTopSpeed": [("-", 1), ("*", 100)],  # Top Speed (+10%) >  1.100000023841858 > 10.000002384185791
-    "Vehicle_BoostSpeed": [("*", 100)],  # Boost Power (+65%) > 0.6525779366493225 > 65.25779366493225
-    "Vehicle_BoostTanks": [("*", 100)],  # Boost Tank Size (+25%) > 0.2501475214958191 > 25.01475214958191
-    "Vehicle_SubBoostSpeed": [("*", 100)],  # Acceleration (+26%) > 0.26352986693382263 > 26.352986693382263
-    "Vehicle_LaserDamage": [],  # Mining Laser Power (+???%) > 36.83852767944336
-    "Vehicle_LaserHeatTime": [(1, "-"), ("*", 100)],   # Mining Laser Efficiency (+19%) > 0.8052845001220703 > 19.47154998779297
-    "Vehicle_GunDamage": [],  # Damage (+???%) > 36.83852767944336
-    "Vehicle_GunHeatTime": [(1, "-"), ("*", 100)],  # Weapon Power Efficiency (+18%) > 0.8241346478462219 > 17.586535215377808
-    "Vehicle_GunRate": [(1, "-"), ("*", 100)],  # Rate of Fire (+9%) > 0.9060062170028687 > 9.399378299713135
+# region Configuration
 
-    # endregion
-}
-
-# endregion
-
-# region Data
-
-PI_ROOT = os.path.realpath(f"{os.path.dirname(__file__)}\\..")  # use Pi root directory as starting point
-
-PRODUCT = [  # ordered by occurrence in GcProceduralProductTable
-    "LOOT",
-    "HIST",
-    "BIO",
-    "FOSS",
-    "PLNT",
-    "TOOL",
-    "FARM",
-    "SEA",
-    "FEAR",
-    "SALV",
-    "BONE",
-    "DARK",
-    "STAR",
-    "EXH",
-
-    # ! No treasure and therefore not really relevant for generating its value.
-    # "PASS",  # FreighterPassword
-    # "CAPT",  # FreighterCaptLog
-    # "CREW",  # FreighterCrewList
-    # "UP_FRHYP",  # FreighterTechHyp
-    # "UP_FRSPE",  # FreighterTechSpeed
-    # "UP_FRFUE",  # FreighterTechFuel
-    # "UP_FRTRA",  # FreighterTechTrade
-    # "UP_FRCOM",  # FreighterTechCombat
-    # "UP_FRMIN",  # FreighterTechMine
-    # "UP_FREXP",  # FreighterTechExp
-    # "LUMP",  # DismantleBio
-    # "COG",   # DismantleTech
-    # "DATA",  # DismantleData
-    # "BOTT",  # MessageInBottle
-]
-
-RE_PRODUCT_AGE = re.compile("([0-9]+)")
-
-TECHNOLOGY = {
-    "AlienShip": {
-        "UA_HYP": ["1", "2", "3", "4"],
-        "UA_LAUN": ["1", "2", "3", "4"],
-        "UA_PULSE": ["1", "2", "3", "4"],
-        "UA_S_SHL": ["1", "2", "3", "4"],
-        "UA_SGUN": ["1", "2", "3", "4"],
-        "UA_SLASR": ["1", "2", "3", "4"],
-    },
-    "Exocraft": {
-        "UP_BOOST": ["1", "2", "3", "4"],
-        "UP_EXENG": ["1", "2", "3", "4"],
-        "UP_EXGUN": ["1", "2", "3", "4"],
-        "UP_EXLAS": ["1", "2", "3", "4"],
-    },
-    "Freighter": {
-        "UP_FRCOM": ["1", "2", "3", "4"],
-        "UP_FREXP": ["1", "2", "3", "4"],
-        "UP_FRFUE": ["1", "2", "3", "4"],
-        "UP_FRHYP": ["1", "2", "3", "4"],
-        "UP_FRMIN": ["1", "2", "3", "4"],
-        "UP_FRSPE": ["1", "2", "3", "4"],
-        "UP_FRTRA": ["1", "2", "3", "4"],
-    },
-    "Mech": {
-        "UP_MCENG": ["2", "3", "4"],
-        "UP_MCGUN": ["2", "3", "4"],
-        "UP_MCLAS": ["2", "3", "4"],
-        "UP_MFIRE": ["2", "3", "4"],
-    },
-    "Ship": {
-        "UP_HYP": ["0", "1", "2", "3", "4", "X"],
-        "UP_LAUN": ["0", "1", "2", "3", "4", "X"],
-        "UP_PULSE": ["0", "1", "2", "3", "4", "X"],
-        "UP_S_SHL": ["0", "1", "2", "3", "4", "X"],
-        "UP_SBLOB": ["1", "2", "3", "4", "X"],
-        "UP_SGUN": ["0", "1", "2", "3", "4", "X"],
-        "UP_SLASR": ["1", "2", "3", "4", "X"],
-        "UP_SMINI": ["1", "2", "3", "4", "X"],
-        "UP_SSHOT": ["1", "2", "3", "4", "X"],
-    },
-    "Submarine": {
-        "UP_EXSUB": ["1", "2", "3", "4"],
-        "UP_SUGUN": ["1", "2", "3", "4"],
-    },
-    "Suit": {
-        "UP_COLD": ["1", "2", "3"],
-        "UP_ENGY": ["0", "1", "2", "3", "X"],
-        "UP_HAZ": ["0", "X"],
-        "UP_HOT": ["1", "2", "3"],
-        "UP_JET": ["0", "1", "2", "3", "4", "X"],
-        "UP_RAD": ["1", "2", "3"],
-        "UP_RBSUIT": [""],
-        "UP_SHLD": ["0", "1", "2", "3", "4", "X"],
-        "UP_SNSUIT": [""],
-        "UP_TOX": ["1", "2", "3"],
-        "UP_UNW": ["1", "2", "3"],
-    },
-    "Weapon": {
-        "UP_BOLT": ["0", "1", "2", "3", "4", "X"],
-        "UP_CANN": ["1", "2", "3", "4", "X"],
-        "UP_GREN": ["1", "2", "3", "4", "X"],
-        "UP_LASER": ["0", "1", "2", "3", "4", "X"],
-        "UP_RAIL": ["1", "2", "3", "4", "X"],
-        "UP_SCAN": ["0", "1", "2", "3", "4", "X"],
-        "UP_SENGUN": [""],
-        "UP_SHOT": ["1", "2", "3", "4", "X"],
-        "UP_SMG": ["1", "2", "3", "4", "X"],
-        "UP_TGREN": ["1", "2", "3", "4", "X"],
-    },
-}
+FREE_MEMORY_CHECK_STEPS = 50  # seeds between two checks whether the pending new technologies should be cleared
 
 # endregion
 
@@ -1119,27 +976,116 @@ def try_except(func):
     return wrapper
 
 
-# endregion
+# the game keeps each generated technology in PendingNewTechnologies. clear it once it holds too many or the process has grown too much since the last time.
+# only used for technologies, generated products are not kept anywhere known that could be cleared the same way
+class MemoryGuard(object):
+    def __init__(self, reality_manager, max_elements: int, max_megabytes: int):
+        self.max_bytes = max_megabytes * 1024 * 1024
+        self.max_elements = max_elements
+        self.reality_manager = reality_manager
+
+        self.baseline = process_memory()
+        self.cleared = 0  # total number of elements
+        self.reclaimed = 0  # total number of bytes
+
+    def check(self, seed: int):
+        if seed % FREE_MEMORY_CHECK_STEPS:
+            return
+
+        pending = self.reality_manager.PendingNewTechnologies
+        elements = len(pending)
+        memory = process_memory()
+        if elements < self.max_elements and memory - self.baseline < self.max_bytes:
+            return
+
+        # Note that this may cause some internal issues in the game, so maybe don't load the game... But maybe not? I dunno!
+        pending.clear()
+
+        self.baseline = process_memory()
+        reclaimed = max(memory - self.baseline, 0)  # the game may have grown in the meantime
+        self.cleared += elements
+        self.reclaimed += reclaimed
+
+        logging.debug(f"     > Freed {elements} pending technologies ({reclaimed / 1024 / 1024:.1f} MiB)")
+
+
+# backend that generates the values by calling the game itself
+class RealityManagerBackend(Backend):
+    def __init__(self, reality_manager, memory_guard: MemoryGuard, hot_loop: bool = False):
+        self.hot_loop = hot_loop
+        self.memory_guard = memory_guard
+        self.reality_manager = reality_manager
+        self.stat_names = PROFILE.stat_names
+        self.timer = PhaseTimer()  # replaced by the one of each item while generating
+
+    def product(self, item_name: str, seed: int) -> tuple[str, int, int]:
+        return self.generate_product(self.reality_manager.GenerateProceduralProduct, f"{item_name}#{seed:05}".encode("utf-8"), seed)
+
+    def technology(self, item_name: str, seed: int) -> tuple[str, numpy.ndarray]:
+        return self.generate_technology(self.reality_manager.GenerateProceduralTechnology, f"{item_name}#{seed:05}".encode("utf-8"), seed)
+
+    # one key buffer per item, and the game function and the readers of the needed fields resolved once instead of for each seed
+    def bind(self, kind: str, item_name: str):
+        if not self.hot_loop:
+            return super().bind(kind, item_name)
+
+        key = SeedKey(item_name)
+        if kind == "product":
+            function, generate = self.reality_manager.GenerateProceduralProduct, self.generate_product
+            fields = (_field_reader(cGcProductData, "NameLower"), _field_reader(cGcProductData, "Description"), _field_reader(cGcProductData, "BaseValue"))
+            return lambda seed: generate(function, key.set(seed), seed, fields)
+
+        function, generate = self.reality_manager.GenerateProceduralTechnology, self.generate_technology
+        fields = (_field_reader(cGcTechnology, "NameLower"), _field_reader(cGcTechnology, "StatBonuses"))
+        return lambda seed: generate(function, key.set(seed), seed, fields)
+
+    def generate_product(self, function, key, seed: int, fields: tuple = None) -> tuple[str, int, int]:
+        timer = self.timer
+        start = time.perf_counter()
+
+        pointer = function(key)
+        start = timer.add("game", start)
+
+        if fields:
+            if not pointer:  # like map_struct
+                raise ValueError(f"No product for {seed}")
+            name_lower, description, base_value = fields[0](pointer), fields[1](pointer), fields[2](pointer).value
+        else:
+            generated = map_struct(pointer, cGcProductData)
+            name_lower, description, base_value = generated.NameLower, generated.Description, generated.BaseValue
+        start = timer.add("map_struct", start)
+
+        name = str(name_lower).strip()
+        timer.add("name", start)
+
+        return name, int(RE_PRODUCT_AGE.findall(str(description))[0]), base_value
+
+    def generate_technology(self, function, key, seed: int, fields: tuple = None) -> tuple[str, numpy.ndarray]:
+        timer = self.timer
+        start = time.perf_counter()
+
+        pointer = function(key, False)
+        start = timer.add("game", start)
+
+        if fields:
+            if not pointer:  # like map_struct
+                raise ValueError(f"No technology for {seed}")
+            name_lower, stat_bonuses = fields[0](pointer), fields[1](pointer)
+        else:
+            generated = map_struct(pointer, cGcTechnology)
+            name_lower, stat_bonuses = generated.NameLower, generated.StatBonuses
+        start = timer.add("map_struct", start)
+
+        name = str(name_lower).strip()
+        timer.add("name", start)
+
+        # view the stats in-place and copy them into the canonical layout as the game may free or reuse the memory
+        result = name, numpy.frombuffer(stat_bonuses.value, dtype=PROFILE.stats_bonus_dtype).astype(STATS_BONUS_DTYPE)
+
+        self.memory_guard.check(seed)
+
+        return result
 
-# region Translation
-
-LANGUAGES = [  # order defined by nms_enums.eLanguageRegion
-    "Name (en)",
-    "Name (fr)",
-    "Name (it)",
-    "Name (de)",
-    "Name (es)",
-    "Name (ru)",
-    "Name (pl)",
-    "Name (nl)",
-    "Name (pt)",
-    "Name (es-419)",
-    "Name (pt-BR)",
-    "Name (ja)",
-    "Name (zh-Hans)",
-    "Name (zh-Hant)",
-    "Name (ko)",
-]
 
 # endregion
 
@@ -1168,6 +1114,19 @@ LANGUAGES = [  # order defined by nms_enums.eLanguageRegion
 #       Updated to NMS.py 0.7.1 that uses pyMHF 0.1.8 as backend
 #       Additionally add Parquet files as output for better programmatic processing
 
+# 1.3.0
+#       Vectorized perfection, transformation, and stat bonuses with NumPy and collect seeds in preallocated columns
+#       Added streaming of seeds in row groups with resume of interrupted generations
+#       Added names only mode to add the names of another language without generating everything again
+#       Added capture of the raw output per game version to rebuild all files offline and a benchmark without the game
+#       Generate with the game in a producer and process in a consumer thread, called within a time budget per frame
+#       Added hot loop mode and clearing of pending technologies by element and memory budget
+#       Added pause, resume, and cancel of the generation with its progress and an estimated remaining time
+#       Order items by the costs of earlier runs
+#       Added a report of each phase per item, optional cProfile and tracemalloc, and a history of all runs in SQLite
+#       Added optional compact storage, sorting by perfection, and names in separate files for Parquet
+#       Embed the meta of each item in its Parquet file and write a summary with the best seeds next to it
+
 # endregion
 
 
@@ -1176,10 +1135,19 @@ class PiModState(ModState):
     # does not work at the moment due to "access violation reading" (a multi threading issue)
     # executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="Pi_Executor")
 
+    capture : bool = False  # additionally save the raw output of the game to rebuild all files offline
+    checkpoint : Checkpoint = None
+    compact_storage : bool = False  # dictionary-encoded names, float32 bonuses, and zstd in the Parquet files
+    free_memory_elements : int = 250  # clear the pending new technologies once they have this many elements...
+    free_memory_megabytes : int = 1024  # ...or the game has grown by this much since they were cleared the last time
+    frame_budget : int = 8  # milliseconds per frame to call the game in, 0 to call it in a tight loop from the background
+    hot_loop : bool = False  # reuse the key buffer, bind the game functions and fields once, and pause the garbage collector while generating
+    item_order : str = "ingame"  # order of the items of each kind, one of ITEM_ORDERS
     language = None  # name of column to write the name in, will be set automatically
 
+    names_only : bool = False  # only update the names of the current language in existing files
+
     is_fully_booted : bool = False
-    is_generation_started : bool = False
     is_reality_manager_constructed : bool = False
 
     product_counter = (Counter(), Counter())  # spawned, finished
@@ -1188,6 +1156,17 @@ class PiModState(ModState):
     product_manual : list = None
     product_start_time : datetime = None
 
+    profile_cpu : bool = False  # cProfile of each item for the next generation
+    profile_memory : bool = False  # tracemalloc of each item for the next generation
+
+    resume : bool = False  # skip finished items and continue interrupted ones of the same game version and language
+
+    sidecar_names : bool = False  # names of each language in their own Parquet and CSV file next to the stats
+
+    sort_by_perfection : bool = False  # Parquet files with the best seeds first in small row groups
+
+    streaming_seeds : int = 0  # write generated seeds in blocks of this size to bound the memory usage, 0 to write all at once
+
     technology_counter = (Counter(), Counter())  # spawned, finished
     technology_counter_total : int = 0
     technology_generation_enabled : bool = True
@@ -1200,10 +1179,12 @@ class PiMod(NMSMod):
 
     __author__ = "zencq"
     __description__ = "Generate data for all procedural items."
-    __version__ = "1.2.0"
+    __version__ = "1.3.0"
 
     def __init__(self):
         super().__init__()
+        self.jobs = JobManager()  # generation runs in the background to keep the mod responsive
+        self.scheduler = None  # calls into the game are made on its own thread while set
         self.state = PiModState()
 
     # region Construct
@@ -1219,6 +1200,12 @@ class PiMod(NMSMod):
         self.state.fully_booted = True
         logging.info(f">> Pi: The game is now fully booted.")
 
+    # runs the calls into the game that fit into the frame budget on the game's own thread
+    @main_loop.after
+    def run_generation_frame(self):
+        if self.scheduler:
+            self.scheduler.tick()
+
 
     # endregion
 
@@ -1242,6 +1229,134 @@ class PiMod(NMSMod):
     def product_manual(self, value: str):
         self.state.product_manual = [item.strip() for item in value.upper().split(",") if item.strip()]
 
+    @property
+    @BOOLEAN(label="Capture raw output")
+    def capture(self):
+        return self.state.capture
+
+    @capture.setter
+    def capture(self, value: bool):
+        self.state.capture = value
+
+    @property
+    @BOOLEAN(label="Compact Parquet")
+    def compact_storage(self):
+        return self.state.compact_storage
+
+    @compact_storage.setter
+    def compact_storage(self, value: bool):
+        self.state.compact_storage = value
+
+    @property
+    @INTEGER(label="Frame budget (ms, 0 = tight loop)")
+    def frame_budget(self):
+        return self.state.frame_budget
+
+    @frame_budget.setter
+    def frame_budget(self, value: int):
+        self.state.frame_budget = max(value, 0)
+
+    @property
+    @STRING(label="Item order", hint="ingame, shortest, or stalest")
+    def item_order(self):
+        return self.state.item_order
+
+    @item_order.setter
+    def item_order(self, value: str):
+        value = value.strip().lower()
+        if value in ITEM_ORDERS:
+            self.state.item_order = value
+
+    @property
+    @BOOLEAN(label="Hot loop")
+    def hot_loop(self):
+        return self.state.hot_loop
+
+    @hot_loop.setter
+    def hot_loop(self, value: bool):
+        self.state.hot_loop = value
+
+    @property
+    @INTEGER(label="Free memory at pending technologies")
+    def free_memory_elements(self):
+        return self.state.free_memory_elements
+
+    @free_memory_elements.setter
+    def free_memory_elements(self, value: int):
+        self.state.free_memory_elements = max(value, 1)
+
+    @property
+    @INTEGER(label="Free memory at growth (MiB)")
+    def free_memory_megabytes(self):
+        return self.state.free_memory_megabytes
+
+    @free_memory_megabytes.setter
+    def free_memory_megabytes(self, value: int):
+        self.state.free_memory_megabytes = max(value, 1)
+
+    @property
+    @BOOLEAN(label="Names only (current language)")
+    def names_only(self):
+        return self.state.names_only
+
+    @names_only.setter
+    def names_only(self, value: bool):
+        self.state.names_only = value
+
+    @property
+    @BOOLEAN(label="Profile CPU (cProfile)")
+    def profile_cpu(self):
+        return self.state.profile_cpu
+
+    @profile_cpu.setter
+    def profile_cpu(self, value: bool):
+        self.state.profile_cpu = value
+
+    @property
+    @BOOLEAN(label="Profile memory (tracemalloc)")
+    def profile_memory(self):
+        return self.state.profile_memory
+
+    @profile_memory.setter
+    def profile_memory(self, value: bool):
+        self.state.profile_memory = value
+
+    @property
+    @BOOLEAN(label="Resume previous generation")
+    def resume(self):
+        return self.state.resume
+
+    @resume.setter
+    def resume(self, value: bool):
+        self.state.resume = value
+
+    @property
+    @BOOLEAN(label="Names in separate files")
+    def sidecar_names(self):
+        return self.state.sidecar_names
+
+    @sidecar_names.setter
+    def sidecar_names(self, value: bool):
+        self.state.sidecar_names = value
+
+    @property
+    @BOOLEAN(label="Sort by perfection")
+    def sort_by_perfection(self):
+        return self.state.sort_by_perfection
+
+    @sort_by_perfection.setter
+    def sort_by_perfection(self, value: bool):
+        self.state.sort_by_perfection = value
+
+    @property
+    @INTEGER(label="Seeds per row group (0 = all at once)")
+    def streaming_seeds(self):
+        return self.state.streaming_seeds
+
+    @streaming_seeds.setter
+    def streaming_seeds(self, value: int):
+        self.state.streaming_seeds = max(value, 0)
+
     @property
     @BOOLEAN(label="Technologies")
     def technology_generation_enabled(self):
@@ -1283,61 +1398,75 @@ class PiMod(NMSMod):
         logging.debug(f">> Pi: hook_language_manager_load_after")
         self.update_language(this)
 
-    @staticmethod
-    def extract_previous_languages(read_rows, seed):
-        if seed < len(read_rows):  # just in case read file has less rows than expected
-            # add all languages and get previous translations or empty string
-            return {
-                language: read_rows[seed].get(language, "") or ("zh-Hans" in language and read_rows[seed].get("Name (zh-CN)", "")) or ("zh-Hant" in language and read_rows[seed].get("Name (zh-TW)", "")) or ""
-                for language in LANGUAGES
-            }
-
-        return {}
-
     # endregion
 
     # region Read/Write
 
-    # read existing file to carry over all previous translations
-    @staticmethod
-    def read_existing_file(f_name: str) -> list:
-        if os.path.isfile(f"{f_name}.csv"):
-            with open(f"{f_name}.csv", mode="r", encoding="utf-8", newline="") as f:
-                f.readline()  # skip first line with delimiter indicator
-                reader = csv.DictReader(f, dialect="excel")
-                return list(reader)
-
-        return []
-
-    @staticmethod
-    def write_result(f_name: str, meta: dict, result : list[dict]):
-        fieldnames = ["Seed", "Perfection"] + sorted(meta.keys()) + LANGUAGES
-
-        # CSV
-        with open(f"{f_name}.csv", mode="w", encoding="utf-8", newline="") as f:
-            f.write("sep=,\r\n")
-            writer = csv.DictWriter(f, fieldnames=fieldnames, dialect="excel")
-            writer.writeheader()
-            writer.writerows(result)
-
-        # Parquet
-        schema = pa.schema(
-            [pa.field('Seed', pa.int32(), nullable=False), pa.field('Perfection', pa.float64(), nullable=False)]
-            +
-            [pa.field(column, pa.float64()) for column in meta.keys()]
-            +
-            [pa.field(language, pa.string(), nullable=False) for language in LANGUAGES]
-        )
-        table = pa.Table.from_pylist(result, schema=schema)
-        with pq.ParquetWriter(f"{f_name}.parquet", schema) as writer:
-            writer.write_table(table)
+    def is_streaming(self) -> bool:
+        return 0 < self.state.streaming_seeds < TOTAL_SEEDS
+
+    # sorting by perfection holds the whole item in memory, which is what streaming avoids, so it is only done without
+    def get_item_storage(self) -> StorageProfile:
+        return get_storage("compact" if self.state.compact_storage else "default", self.state.sort_by_perfection and not self.is_streaming(), self.state.sidecar_names)
+
+    # raw output can only be captured for an item generated from its first seed
+    def prepare_cache(self, cls, inventory_type: str, item_name: str, progress: dict, **kwargs):
+        if not self.state.capture:
+            return None
+
+        if progress:
+            logging.info(f"   > {item_name} > Raw output not captured as the generation continues at seed {progress['seeds']}")
+            return None
+
+        return cls(cache_path(PROFILE.version, inventory_type, item_name), self.state.language, {"version": PROFILE.version}, **kwargs)
+
+    # get progress of an item from a previous run if resuming is enabled, otherwise discard it
+    def load_progress(self, item_name: str) -> dict:
+        progress = self.state.checkpoint.get(item_name, PROFILE.version, self.state.language)
+
+        if self.state.resume and progress.get("finished"):
+            return progress
+
+        # blocks can only be continued while streaming and if all of them still exist
+        if self.state.resume and progress and self.is_streaming() and all(os.path.isfile(part) for part in progress["parts"]):
+            logging.info(f"   > {item_name} > Continue at seed {progress['seeds']}")
+            return progress
+
+        # start from scratch
+        for part in self.state.checkpoint.items.get(item_name, {}).get("parts", []):
+            if os.path.isfile(part):
+                os.remove(part)
+        self.state.checkpoint.remove(item_name)
+
+        return {}
+
+    def save_progress(self, item_name: str, **progress):
+        self.state.checkpoint.update(item_name, {
+            "version": PROFILE.version,
+            "language": self.state.language,
+            **progress,
+        })
+
+    # log the outcome of an item and mark it as finished. progress of failed ones is kept to be able to resume them
+    def finish_procedural_item(self, job: ItemJob, kind: str):
+        stats, size = CostModel.measure(job.builder.f_name) if job.status == "finished" else (0, 0)
+        self.report.add(job.item_name, kind, job.status, (datetime.now() - job.start_time).total_seconds(), job.builder.timer, stats, size)
+
+        if job.status == "finished":
+            self.save_progress(job.item_name, finished=True)
+            logging.info(f"   > {job.item_name} > {datetime.now() - job.start_time}")
+        elif job.status == "unavailable":
+            logging.warning(f"  ! {job.item_name} > {kind} not available in your game version.")  # one space less as warning moves it one to the right
+            self.state.checkpoint.remove(job.item_name)
+        elif job.status == "cancelled":
+            logging.warning(f"  ! {job.item_name} > Cancelled.")
 
     # endregion
 
     @gui_button("Start Generating")
     def start_generating(self):
-        if pymhf_internal.BINARY_HASH not in KNOWN_BINARY_HASH:
-            logging.error(f">> Pi: The used executable is unknown. This mod only works with the following GOG.com versions: {', '.join(KNOWN_BINARY_HASH.values())}")
+        if PROFILE is None:
+            logging.error(f">> Pi: The used executable is unknown. This mod only works with the following GOG.com versions: {', '.join(profile.version for profile in KNOWN_VERSION_PROFILES.values())}")
             return
 
         if not all([self.state.is_reality_manager_constructed]):
@@ -1348,96 +1477,200 @@ class PiMod(NMSMod):
             logging.error(f">> Pi: The game is not fully booted yet. Try again after it says it is.")
             return
 
-        if self.state.is_generation_started:
+        if not self.jobs.start(self.run_generation):
             logging.warning(f">> Pi: Please wait until the currently running generation has finished...")
-            return
 
-        self.state.is_generation_started = True
+    @gui_button("Pause")
+    def pause_generating(self):
+        if self.jobs.running:
+            self.jobs.pause()
+            logging.info(f">> Pi: Generation paused after the current batch of seeds.")
+
+    @gui_button("Resume")
+    def resume_generating(self):
+        if self.jobs.running:
+            self.jobs.resume()
+            logging.info(f">> Pi: Generation resumed.")
+
+    @gui_button("Cancel")
+    def cancel_generating(self):
+        if self.jobs.running:
+            self.jobs.cancel()
+            logging.info(f">> Pi: Generation will be cancelled after the current batch of seeds. Enable resume to continue it later.")
+
+    @property
+    @STRING(label="Progress")
+    def progress(self):
+        return self.jobs.progress()
+
+    # the entire generation, run in the background by the job manager
+    @try_except
+    def run_generation(self):
+        memory_guard = MemoryGuard(self.reality_manager, self.state.free_memory_elements, self.state.free_memory_megabytes)
+        self.backend = RealityManagerBackend(self.reality_manager, memory_guard, self.state.hot_loop)
+        self.state.checkpoint = Checkpoint(os.path.join(PI_ROOT, "Pi.checkpoint.json"))
+        self.report = RunReport(
+            os.path.join(PI_ROOT, "Pi.report"),
+            version=PROFILE.version,
+            binary_hash=pymhf_internal.BINARY_HASH,
+            mod_version=self.__version__,
+            nmspy_version=package_version("nmspy"),
+            pymhf_version=package_version("pymhf"),
+            language=self.state.language,
+            hot_loop=self.state.hot_loop,
+            streaming_seeds=self.state.streaming_seeds,
+        )
+        self.costs = CostModel(os.path.join(PI_ROOT, "Pi.costs.json"))
+
+        if self.state.sort_by_perfection and self.is_streaming():
+            logging.warning(f">> Pi: Sort by perfection is ignored with seeds per row group as it would hold each item in memory.")
+
+        profiler = None
+        if self.state.profile_cpu or self.state.profile_memory:
+            profiler = RunProfiler(os.path.join(PI_ROOT, "Profile", datetime.now().strftime("%Y-%m-%d_%H-%M-%S")), self.state.profile_cpu, self.state.profile_memory)
+            logging.info(f">> Pi: Profiles of each item are written to {profiler.directory}")
+
+        # the game is called in slices of the budget on each frame while this thread waits, see run_generation_frame()
+        self.scheduler = FrameScheduler(self.state.frame_budget / 1000) if self.state.frame_budget else None
+
+        # items are written in the background while the next ones are generated
+        with Pipeline(self.backend, profiler=profiler, jobs=self.jobs, scheduler=self.scheduler) as self.pipeline:
+            if self.product_generation_enabled:
+                self.start_generating_procedural_product()
+            if self.technology_generation_enabled:
+                self.start_generating_procedural_technology()
+
+        self.scheduler = None
+
+        if memory_guard.cleared:
+            logging.info(f">> Pi: Freed {memory_guard.cleared} pending technologies ({memory_guard.reclaimed / 1024 / 1024:.1f} MiB) while generating.")
+
+        # timing of each phase per item to see whether the game or Pi itself is the bottleneck
+        self.report.write()
+        self.costs.update(self.report)
+        self.costs.write()
+        with RunHistory(os.path.join(PI_ROOT, "Pi.history.sqlite")) as history:
+            history.record(self.report)
+        if profiler:
+            profiler.close()
+
+        if self.jobs.cancelled.is_set():
+            logging.info(f">> Pi: Generation cancelled after {self.jobs.items_done} of {self.jobs.items_total} items.")
+
+    # probe seed 0 of each item to skip unavailable ones up front, then order them and register their expected seconds for the progress
+    def plan_procedural_items(self, kind: str, items: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        generate = self.backend.product if kind == "Product" else self.backend.technology
+
+        available = []
+        finished = set()  # skipped anyway
+        self.backend.timer = PhaseTimer()  # the probes are not part of any item
+        for inventory_type, item_name in items:
+            if self.load_progress(item_name).get("finished"):
+                available.append((inventory_type, item_name))
+                finished.add(item_name)
+                continue
+
+            try:
+                self.pipeline.run(lambda seed: generate(item_name, seed), range(1))
+            except ItemUnavailableError:
+                logging.warning(f"  ! {item_name} > {kind} not available in your game version.")  # one space less as warning moves it one to the right
+                self.state.checkpoint.remove(item_name)
+                continue
+
+            available.append((inventory_type, item_name))
+
+        result = self.costs.order(available, self.state.item_order)
+        self.jobs.add_items({item_name: 0.0 if item_name in finished else self.costs.estimate(inventory_type, item_name) for inventory_type, item_name in result})
+
+        return result
+
+    # region Names
+
+    # only generate the names of the current language and update the existing files of an item with them
+    @try_except
+    def generate_procedural_names(self, item_name: str, f_name: str, progress: dict, generate):
+        item_start_time = datetime.now()
+        names = numpy.empty(TOTAL_SEEDS, dtype=object)
+        unique_names = {}  # procedural names repeat a lot, so keep only one instance of each
+
+        for start in range(0, TOTAL_SEEDS, PIPELINE_BATCH_SIZE):
+            try:
+                batch = self.pipeline.run(lambda seed: generate(item_name, seed), range(start, min(start + PIPELINE_BATCH_SIZE, TOTAL_SEEDS)))
+            except ItemUnavailableError:
+                logging.warning(f"  ! {item_name} > Not available in your game version.")  # one space less as warning moves it one to the right
+                return
+
+            for seed, raw in batch:
+                names[seed] = unique_names.setdefault(raw[0], raw[0])
+
+            if not self.jobs.proceed(len(batch)):
+                logging.warning(f"  ! {item_name} > {self.state.language} > Cancelled.")
+                return
 
-        if self.product_generation_enabled:
-            self.start_generating_procedural_product()
-        if self.technology_generation_enabled:
-            self.start_generating_procedural_technology()
+        write_names(f_name, self.state.language, names)
 
-        self.state.is_generation_started = False
+        # the item is complete for this language now and interrupted blocks are no longer needed
+        for part in progress.get("parts", []):
+            if os.path.isfile(part):
+                os.remove(part)
+        self.save_progress(item_name, finished=True)
+
+        logging.info(f"   > {item_name} > {self.state.language} > {datetime.now() - item_start_time}")
+
+    # endregion
 
     # region Product
 
     @try_except
     def start_generating_procedural_product(self):
-        self.state.product_counter_total = len(self.state.product_manual or PRODUCT)
         self.state.product_start_time = datetime.now()
+        items = self.plan_procedural_items("Product", select_products(self.state.product_manual))
+        self.state.product_counter_total = len(items)
 
         logging.info(f">> Pi: Generation for {self.state.product_counter_total} {'PRODUCT' if self.state.product_counter_total == 1 else 'PRODUCTS'} started...")
 
-        for item_id in PRODUCT:
-            item_name = f"PROC_{item_id}"
-            if not self.state.product_manual or (item_id in self.state.product_manual) or (item_name in self.state.product_manual):
-                self.state.product_counter[0].increment()
-                # TODO make executor work again
-                # self.state.executor.submit(self.generate_procedural_product, item_name)  # ! access violation reading 0x0000000000000018
-                self.generate_procedural_product(item_name)
+        for _, item_name in items:
+            if self.jobs.cancelled.is_set():
+                return
+
+            self.state.product_counter[0].increment()
+            # TODO make executor work again
+            # self.state.executor.submit(self.generate_procedural_product, item_name)  # ! access violation reading 0x0000000000000018
+            self.generate_procedural_product(item_name)
 
     @try_except
     def generate_procedural_product(self, item_name):
-        available = True
         item_start_time = datetime.now()
-        meta = {}  # keep track of min/max/weighting for perfection calculation
-        result = []  # result for each seed
-
-        f_name = f"{PI_ROOT}\\Product\\{item_name}"
-
-        read_rows = self.read_existing_file(f_name)
 
-        for seed in range(TOTAL_SEEDS):
-            pointer = self.reality_manager.GenerateProceduralProduct(f"{item_name}#{seed:05}".encode("utf-8"))
-            try:
-                generated = map_struct(pointer, cGcProductData)
-            except ValueError:
-                available = False
-                logging.warning(f"  ! {item_name} > Product not available in your game version.")  # one space less as warning moves it one to the right
-                break
-
-            # carry over all previous translations
-            row = self.extract_previous_languages(read_rows, seed)
-
-            # add seed and current translation
-            row.update({
-                self.state.language: str(generated.NameLower).strip(),  # name for current language
-                "Age": int(RE_PRODUCT_AGE.findall(str(generated.Description))[0]),
-                "Seed": seed,
-                "Value": generated.BaseValue,
-            })
-
-            # update to track meta values
-            if not meta:
-                logging.debug(f"     > Age > {row.get('Age')}")
-                logging.debug(f"     > Value > {generated.BaseValue}")
-                meta = [generated.BaseValue, generated.BaseValue]
-            else:
-                meta = [
-                    min(meta[0], generated.BaseValue),
-                    max(meta[1], generated.BaseValue),
-                ]
-
-            # add completed row to result
-            result.append(row)
+        f_name = item_path("Product", item_name)
 
-        if available:
-            # add calculated perfection
-            for row in result:
-                row.update({
-                    "Perfection": 1.0 - (meta[1] - row["Value"]) / (meta[1] - meta[0]),
-                })
+        progress = self.load_progress(item_name)
+        if progress.get("finished"):
+            logging.info(f"   > {item_name} > Skipped as it is already finished.")
+            self.state.product_counter[1].increment()
+            self.check_procedural_product_generation_finished(item_name)
+            return
 
-            self.write_result(f_name, {"Age": None, "Value": None}, result)
+        if self.state.names_only and os.path.isfile(f"{f_name}.parquet"):
+            self.generate_procedural_names(item_name, f_name, progress, self.backend.product)
+            self.state.product_counter[1].increment()
+            self.check_procedural_product_generation_finished(item_name)
+            return
 
-            logging.info(f"   > {item_name} > {datetime.now() - item_start_time}")
+        builder = ProductBuilder(f_name, self.state.streaming_seeds, progress, lambda **kwargs: self.save_progress(item_name, **kwargs))
+        builder.storage = self.get_item_storage()
+        builder.version = PROFILE.version
+        cache = self.prepare_cache(ProductCache, "Product", item_name, progress)
+        self.pipeline.generate(ItemJob(item_name, self.state.language, builder, cache, self.finish_procedural_product, item_start_time))
 
+    # called by the pipeline after the item is written or given up
+    def finish_procedural_product(self, job: ItemJob):
+        self.finish_procedural_item(job, "Product")
         self.state.product_counter[1].increment()
-        self.check_procedural_product_generation_finished()
+        self.check_procedural_product_generation_finished(job.item_name)
 
-    def check_procedural_product_generation_finished(self):
+    def check_procedural_product_generation_finished(self, item_name: str):
+        self.jobs.item_done(item_name)  # called once for each item
         if self.state.product_counter[0].value == self.state.product_counter[1].value == self.state.product_counter_total:
             logging.info(f">> Pi: PRODUCT generation finished in {datetime.now() - self.state.product_start_time}!")
             self.state.product_counter[0].reset()
@@ -1449,145 +1682,54 @@ class PiMod(NMSMod):
 
     @try_except
     def start_generating_procedural_technology(self):
-        self.state.technology_counter_total = (self.state.technology_manual and len([True for inventory_type, items in TECHNOLOGY.items() for item_id, qualities in items.items() for quality in qualities if any((key in self.state.technology_manual) for key in [inventory_type, item_id, f"{item_id}{quality}"])])) or sum(len(qualities) for items in TECHNOLOGY.values() for qualities in items.values())
         self.state.technology_start_time = datetime.now()
+        items = self.plan_procedural_items("Technology", select_technologies(self.state.technology_manual))
+        self.state.technology_counter_total = len(items)
 
         logging.info(f">> Pi: Generation for {self.state.technology_counter_total} {'TECHNOLOGY' if self.state.technology_counter_total == 1 else 'TECHNOLOGIES'} started...")
 
-        for inventory_type, items in TECHNOLOGY.items():
-            for item_id, qualities in items.items():
-                for quality in qualities:
-                    item_name = f"{item_id}{quality}"
-                    if not self.state.technology_manual or any((key in self.state.technology_manual) for key in [inventory_type, item_id, item_name]):
-                        self.state.technology_counter[0].increment()
-                        # TODO make executor work again
-                        # self.state.executor.submit(self.generate_procedural_technology, inventory_type, item_name)  # ! access violation reading
-                        self.generate_procedural_technology(inventory_type, item_name)
+        for inventory_type, item_name in items:
+            if self.jobs.cancelled.is_set():
+                return
+
+            self.state.technology_counter[0].increment()
+            # TODO make executor work again
+            # self.state.executor.submit(self.generate_procedural_technology, inventory_type, item_name)  # ! access violation reading
+            self.generate_procedural_technology(inventory_type, item_name)
 
     @try_except
     def generate_procedural_technology(self, inventory_type, item_name):
-        available = True
         item_start_time = datetime.now()
-        meta = {}  # keep track of min/max/weighting for perfection calculation
-        number = 0  # maximum number of unique stats per seed
-        result = []  # result for each seed
 
-        f_name = f"{PI_ROOT}\\{inventory_type}\\{item_name}"
+        f_name = item_path(inventory_type, item_name)
 
-        read_rows = self.read_existing_file(f_name)
-
-        for seed in range(TOTAL_SEEDS):
-            pointer = self.reality_manager.GenerateProceduralTechnology(f"{item_name}#{seed:05}".encode("utf-8"), False)
-            try:
-                generated = map_struct(pointer, cGcTechnology)
-            except ValueError:
-                available = False
-                logging.warning(f"  ! {item_name} > Technology not available in your game version.")  # one space less as warning moves it one to the right
-                break
-
-            number = max(number, len(generated.StatBonuses.value))
-            row = self.extract_previous_languages(read_rows, seed)  # carry over all previous translations
-
-            # add seed and current translation
-            row.update({
-                self.state.language: str(generated.NameLower).strip(),  # name for current language
-                "Seed": seed,
-            })
-
-            # update to track meta values
-            for stat_bonus in generated.StatBonuses.value:
-                stat = safe_assign_enum(eStatsType, stat_bonus.Stat._meStatsType).name
-                stat_value = row[stat] = self.transform_value(stat, stat_bonus.Bonus)  # add in-game like value of a stat
-
-                if stat not in meta:
-                    logging.debug(f"     > {stat} > {stat_bonus.Bonus} > {stat_value}")  # to see how the value looks
-                    meta[stat] = [stat_value, stat_value]
-                else:
-                    meta[stat] = [
-                        min(meta[stat][0], stat_value),
-                        max(meta[stat][1], stat_value),
-                    ]
-
-            # add completed row to result
-            result.append(row)
-
-            if seed % FREE_MEMORY_STEPS == 0:
-                # Clear the pending new technologies to free up some memory.
-                # Note that this may cause some internal issues in the game, so maybe don't load the game... But maybe not? I dunno!
-                self.reality_manager.PendingNewTechnologies.clear()
-
-        if available:
-            weighting = [stat[1] - stat[0] + 1 for stat in meta.values()]  # max - min + 1
-            weighting_min = min(weighting)
-
-            # add weighting to each stat
-            meta = {key: value + [value[1] - value [0], weighting[i] / weighting_min] for i, (key, value) in enumerate(meta.items())}
-
-            for row in result:
-                perfection = []
-                weighting_total = 0
-
-                # calculate perfection for each seed
-                for stat_name, stat_meta in meta.items():
-                    if stat_name not in row:
-                        continue
-
-                    stat_value = row[stat_name]
-                    weight = stat_meta[3]
-                    weighting_total += weight
-
-                    p = 1.0
-                    if stat_meta[2] > 0:
-                        p -= (stat_meta[1] - stat_value) / stat_meta[2]
-                    perfection.append(p * weight)
-
-                # add calculated perfection
-                row.update({
-                    "Perfection": (sum(perfection) / weighting_total) * (len(perfection) / number),
-                })
+        progress = self.load_progress(item_name)
+        if progress.get("finished"):
+            logging.info(f"   > {item_name} > Skipped as it is already finished.")
+            self.state.technology_counter[1].increment()
+            self.check_procedural_technology_generation_finished(item_name)
+            return
 
-            self.write_result(f_name, meta, result)
+        if self.state.names_only and os.path.isfile(f"{f_name}.parquet"):
+            self.generate_procedural_names(item_name, f_name, progress, self.backend.technology)
+            self.state.technology_counter[1].increment()
+            self.check_procedural_technology_generation_finished(item_name)
+            return
 
-            logging.info(f"   > {item_name} > {datetime.now() - item_start_time}")
+        builder = TechnologyBuilder(f_name, self.state.streaming_seeds, progress, lambda **kwargs: self.save_progress(item_name, **kwargs))
+        builder.storage = self.get_item_storage()
+        builder.version = PROFILE.version
+        cache = self.prepare_cache(TechnologyCache, inventory_type, item_name, progress, stat_names=self.backend.stat_names)
+        self.pipeline.generate(ItemJob(item_name, self.state.language, builder, cache, self.finish_procedural_technology, item_start_time))
 
+    # called by the pipeline after the item is written or given up
+    def finish_procedural_technology(self, job: ItemJob):
+        self.finish_procedural_item(job, "Technology")
         self.state.technology_counter[1].increment()
-        self.check_procedural_technology_generation_finished()
-
-    # transform raw value to look more like in-game
-    @staticmethod
-    def transform_value(stat, bonus):
-        if stat not in TRANSFORM:
-            logging.warning(f"     > not in TRANSFORM > {stat} > {bonus}")
-
-        for instruction in TRANSFORM.get(stat, []):
-            if isinstance(instruction[0], str):  # operator first (bonus - 1)
-                if instruction[0] == "+":
-                    bonus += instruction[1]
-
-                if instruction[0] == "-":
-                    bonus -= instruction[1]
-
-                if instruction[0] == "*":
-                    bonus *= instruction[1]
-
-                if instruction[0] == "/":
-                    bonus /= instruction[1]
-            else:  # operator second (1 - bonus)
-                if instruction[1] == "+":
-                    bonus = instruction[0] + bonus
-
-                if instruction[1] == "-":
-                    bonus = instruction[0] - bonus
-
-                if instruction[1] == "*":
-                    bonus = instruction[0] * bonus
-
-                if instruction[1] == "/":
-                    bonus = instruction[0] / bonus
-
-        return bonus
+        self.check_procedural_technology_generation_finished(job.item_name)
 
-    def check_procedural_technology_generation_finished(self):
+    def check_procedural_technology_generation_finished(self, item_name: str):
+        self.jobs.item_done(item_name)  # called once for each item
         if self.state.technology_counter[0].value == self.state.technology_counter[1].value == self.state.technology_counter_total:
             logging.info(f">> Pi: TECHNOLOGY generation finished in {datetime.now() - self.state.technology_start_time}!")
             self.state.technology_counter[0].reset()
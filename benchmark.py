@@ -0,0 +1,108 @@
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from contextlib import nullcontext
+
+import pi_engine
+
+from pi_engine import (
+    LANGUAGES,
+    STORAGE_PROFILES,
+    StorageProfile,
+    CacheBackend,
+    ProductBuilder,
+    SyntheticBackend,
+    TechnologyBuilder,
+    gc_paused,
+    get_storage,
+    select_products,
+    select_technologies,
+    write_result,
+)
+
+
+# region Configuration
+
+PHASES = ["generate", "build", "transform", "perfection", "write"]
+
+# endregion
+
+
+# all items in the same order as in-game, optionally filtered by inventory type, item id, or item name
+def get_items(items: list) -> list[tuple[str, str]]:
+    return select_products(items) + select_technologies(items)
+
+
+# measure the seeds per second of each phase of the Python side for an item
+def benchmark_item(backend, inventory_type: str, item_name: str, directory: str, storage: StorageProfile) -> dict[str, float]:
+    seconds = {}
+    total_seeds = pi_engine.TOTAL_SEEDS
+
+    # values as returned by the game
+    start = time.perf_counter()
+    generate = backend.bind("product" if inventory_type == "Product" else "technology", item_name)
+    with gc_paused() if backend.hot_loop else nullcontext():
+        records = [generate(seed) for seed in range(total_seeds)]
+    seconds["generate"] = time.perf_counter() - start
+
+    # result for each seed
+    start = time.perf_counter()
+    builder = (ProductBuilder if inventory_type == "Product" else TechnologyBuilder)(os.path.join(directory, item_name), previous_languages={})
+    for seed, raw in enumerate(records):
+        builder.add_raw(seed, LANGUAGES[0], raw, backend.stat_names)
+    seconds["build"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    builder.finish_block()
+    seconds["transform"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    meta = builder.meta()
+    perfection = builder.perfection(meta, builder.result.stat_columns())
+    seconds["perfection"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    write_result(builder.f_name, meta, builder.result.to_table(), perfection, storage=storage)
+    seconds["write"] = time.perf_counter() - start
+
+    return {phase: total_seeds / seconds[phase] for phase in PHASES}
+
+
+def benchmark(backend, items: list[tuple[str, str]], storage: StorageProfile) -> None:
+    print(f"{'Seeds/s':16}" + "".join(f"{phase:>16}" for phase in PHASES))
+
+    with tempfile.TemporaryDirectory(prefix="Pi_benchmark_") as directory:
+        for inventory_type, item_name in items:
+            try:
+                rates = benchmark_item(backend, inventory_type, item_name, directory, storage)
+            except ValueError as e:
+                logging.warning(f"  ! {item_name} > {e}")
+                continue
+
+            print(f"{item_name:16}" + "".join(f"{rates[phase]:>16,.0f}" for phase in PHASES))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measures the generation of procedural items without the game.")
+
+    parser.add_argument("-c", "--cache", metavar="VERSION", help="Replay the raw output captured for this game version instead of synthetic values.")
+    parser.add_argument("-l", "--hot-loop", action="store_true", help="Pause the garbage collector while generating.")
+    parser.add_argument("-i", "--items", nargs="*", default=[], help="Only measure these inventory types or items.")
+    parser.add_argument("-s", "--storage", choices=STORAGE_PROFILES.keys(), default="default", help="Storage profile of the Parquet files.")
+    parser.add_argument("--sort-by-perfection", action="store_true", help="Write the Parquet files with the best seeds first.")
+    parser.add_argument("--sidecar-names", action="store_true", help="Write the names of each language to their own Parquet file.")
+    parser.add_argument("-n", "--seeds", type=int, default=pi_engine.TOTAL_SEEDS, help="Number of seeds per item.")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(format="%(message)s", level=logging.INFO)
+
+    pi_engine.TOTAL_SEEDS = args.seeds
+
+    backend = CacheBackend(args.cache) if args.cache else SyntheticBackend()
+    backend.hot_loop = args.hot_loop
+
+    benchmark(backend, get_items([item.upper() for item in args.items]), get_storage(args.storage, args.sort_by_perfection, args.sidecar_names))
@@ -0,0 +1,68 @@
+import argparse
+import logging
+import os
+import sys
+
+from pi_engine import PI_ROOT, RunHistory
+
+
+# compare the seeds per second of each item of a run against a baseline and return whether any of them regressed
+def compare_runs(history: RunHistory, baseline_id: int, run_id: int, threshold: float) -> bool:
+    rows = history.compare(baseline_id, run_id, threshold)
+    if not rows:
+        logging.warning(f">> Pi: Run {run_id} and run {baseline_id} have no finished items in common.")
+        return False
+
+    print(f"{'Seeds/s':16}{'baseline':>16}{'latest':>16}{'change':>16}  phase")
+    for row in sorted(rows, key=lambda row: row["change"]):
+        print(f"{row['item_name']:16}{row['baseline']:>16,.0f}{row['latest']:>16,.0f}{row['change']:>16.1%}  {row['phase'] if row['regressed'] else ''}")
+
+    regressed = [row["item_name"] for row in rows if row["regressed"]]
+    if regressed:
+        logging.warning(f">> Pi: {len(regressed)} of {len(rows)} items of run {run_id} are more than {threshold:.0%} slower than in run {baseline_id}: {', '.join(regressed)}")
+    else:
+        logging.info(f">> Pi: No item of run {run_id} is more than {threshold:.0%} slower than in run {baseline_id}.")
+
+    return bool(regressed)
+
+
+def list_runs(history: RunHistory) -> None:
+    print(f"{'Run':>6}  {'Start':20}{'Version':10}{'Mod':10}{'NMS.py':10}{'pyMHF':10}{'Items':>6}")
+    for run in history.runs():
+        print(f"{run['id']:>6}  {run['start_time']:20}{run['version'] or '':10}{run['mod_version'] or '':10}{run['info'].get('nmspy_version', ''):10}{run['info'].get('pymhf_version', ''):10}{len(history.items(run['id'])):>6}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compares the seeds per second of the latest generation run against a baseline.")
+
+    parser.add_argument("-b", "--baseline", type=int, help="Run to compare against (default: the one before the latest).")
+    parser.add_argument("-l", "--list", action="store_true", help="List all recorded runs instead.")
+    parser.add_argument("-r", "--run", type=int, help="Run to compare (default: the latest).")
+    parser.add_argument("-t", "--threshold", type=float, default=10.0, help="Drop in seeds per second in percent to flag an item.")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(format="%(message)s", level=logging.INFO)
+
+    f_name = os.path.join(PI_ROOT, "Pi.history.sqlite")
+    if not os.path.isfile(f_name):
+        logging.error(f">> Pi: No runs recorded yet in {f_name}.")
+        sys.exit(2)
+
+    with RunHistory(f_name) as history:
+        if args.list:
+            list_runs(history)
+            sys.exit(0)
+
+        run_ids = [run["id"] for run in history.runs()]
+        if not run_ids:
+            logging.error(f">> Pi: No runs recorded yet in {f_name}.")
+            sys.exit(2)
+
+        run_id = args.run or run_ids[-1]
+        baseline_id = args.baseline or max((previous for previous in run_ids if previous < run_id), default=None)
+        if baseline_id is None:
+            logging.error(f">> Pi: There is no run before run {run_id} to compare against.")
+            sys.exit(2)
+
+        sys.exit(1 if compare_runs(history, baseline_id, run_id, args.threshold / 100) else 0)
@@ -0,0 +1,73 @@
+import argparse
+import glob
+import logging
+import os
+import tempfile
+import time
+
+from pi_engine import LANGUAGES, PI_ROOT, STORAGE_PROFILES, StorageProfile, convert_storage, get_storage, parquet_path, read_item
+
+
+# size of the Parquet file of an item in bytes, including the names of the sidecar layout
+def item_size(f_name: str) -> int:
+    return sum(os.path.getsize(parquet_path(f_name, language)) for language in [None] + LANGUAGES if os.path.isfile(parquet_path(f_name, language)))
+
+
+# best of a few full reads of an item in seconds
+def read_seconds(f_name: str, repeat: int = 3) -> float:
+    result = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        read_item(f_name)
+        result.append(time.perf_counter() - start)
+
+    return min(result)
+
+
+# rewrite the Parquet files of all items with a storage profile and report how size and read time changed
+def convert_all(storage: StorageProfile, items: list, dry_run: bool) -> None:
+    total = {"size_before": 0, "size_after": 0, "read_before": 0.0, "read_after": 0.0}
+
+    print(f"{'Item':16}{'MiB before':>12}{'MiB after':>12}{'change':>10}{'read before':>14}{'read after':>14}{'change':>10}")
+    with tempfile.TemporaryDirectory(prefix="Pi_convert_") as directory:
+        for parquet_f_name in sorted(glob.glob(os.path.join(PI_ROOT, "*", "*.parquet"))):
+            inventory_type = os.path.basename(os.path.dirname(parquet_f_name))
+            item_name = os.path.basename(parquet_f_name)[:-len(".parquet")]
+            if "." in item_name or (items and not any((key.upper() in items) for key in [inventory_type, item_name])):  # parts, summaries, and names of the sidecar layout have a dot
+                continue
+
+            f_name = parquet_f_name[:-len(".parquet")]
+            target = os.path.join(directory, item_name) if dry_run else None
+
+            size_before, read_before = item_size(f_name), read_seconds(f_name)
+            convert_storage(f_name, storage, target)
+            size_after, read_after = item_size(target or f_name), read_seconds(target or f_name)
+
+            print(f"{item_name:16}{size_before / 1024 / 1024:>12,.2f}{size_after / 1024 / 1024:>12,.2f}{size_after / size_before - 1:>10.1%}{read_before * 1000:>12,.1f}ms{read_after * 1000:>12,.1f}ms{read_after / read_before - 1:>10.1%}")
+
+            for key, value in zip(total, [size_before, size_after, read_before, read_after]):
+                total[key] += value
+            if target:
+                for target_f_name in glob.glob(f"{target}.*"):
+                    os.remove(target_f_name)
+
+    if total["size_before"]:
+        print(f"{'Total':16}{total['size_before'] / 1024 / 1024:>12,.2f}{total['size_after'] / 1024 / 1024:>12,.2f}{total['size_after'] / total['size_before'] - 1:>10.1%}{total['read_before'] * 1000:>12,.1f}ms{total['read_after'] * 1000:>12,.1f}ms{total['read_after'] / total['read_before'] - 1:>10.1%}")
+    else:
+        logging.warning(f">> Pi: No Parquet files found in {PI_ROOT}.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rewrites the Parquet files of all items with another storage profile and reports the size and read time before and after.")
+
+    parser.add_argument("storage", choices=STORAGE_PROFILES.keys(), help="Storage profile to convert to.")
+    parser.add_argument("-i", "--items", nargs="*", default=[], help="Only convert these inventory types or items.")
+    parser.add_argument("-s", "--sort-by-perfection", action="store_true", help="Sort by perfection with the best seeds first.")
+    parser.add_argument("-c", "--sidecar-names", action="store_true", help="Move the names of each language to their own Parquet file.")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="Only report the changes without replacing the files.")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(format="%(message)s", level=logging.INFO)
+
+    convert_all(get_storage(args.storage, args.sort_by_perfection, args.sidecar_names), [item.upper() for item in args.items], args.dry_run)
@@ -1,11 +1,15 @@
 import argparse
+import json
 import math
+import operator
 import re
 import typing
 import os
 
 import numpy
 import pandas
+import pyarrow
+import pyarrow.parquet as pq
 
 from openpyxl import Workbook
 from openpyxl.cell.cell import Cell
@@ -30,6 +34,12 @@ OUTDATED = {  # outdated or only available since
     "UP_EXSUB": "5.50",
 }
 RE_LANGUAGE = re.compile("\(([A-Za-z1-9-]+)\)")
+TRANSFORM_OPERATORS = {  # the same as in the mod
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
 URL = "https://github.com/zencq/Pi"
 VERSION = "5.00"
 
@@ -370,6 +380,7 @@ class Pi():
 
         # argparse
         self.debug = False
+        self.summaries = False  # read the summary of an item instead of all seeds if available
         self._language = LANGUAGES[1]  # english. name of column to use for the procedural names
 
         # properties to work with
@@ -508,11 +519,16 @@ class Pi():
 
     # region Helper for Pandas
 
-    def get_best_per_stat(self, dataframe_source: pandas.DataFrame) -> typing.Tuple[pandas.DataFrame, int, bool]:
+    def get_best_per_stat(self, dataframe_source: pandas.DataFrame, meta: typing.Dict[str, typing.List[float]] = None) -> typing.Tuple[pandas.DataFrame, int, bool]:
         columns = self.get_stat_column_names_from_dataframe(dataframe_source)
-        columns_max = [dataframe_source[column].max() for column in columns]
+        if meta:  # as written by the mod for the entire file
+            columns_min = [meta[column][0] for column in columns]
+            columns_max = [meta[column][1] for column in columns]
+        else:
+            columns_min = [dataframe_source[column].min() for column in columns]
+            columns_max = [dataframe_source[column].max() for column in columns]
 
-        if all(dataframe_source[column].min() == columns_max[i] for i, column in enumerate(columns)):
+        if all(low == high for low, high in zip(columns_min, columns_max)):
             return dataframe_source.tail(1), len(columns), True
 
         result = pandas.DataFrame()
@@ -553,18 +569,22 @@ class Pi():
 
         return sorted(result)
 
-    # build meta data similar to the NMS.py mod script to be able to recalaculate perfection for Suit_Jetpack_Ignition Hi/Lo desirability
-    def prepare_ignition_meta(self, dataframe: pandas.DataFrame) -> typing.Dict[str, typing.List[float]]:
-        meta =  {
-            stat: [dataframe[stat].min(), dataframe[stat].max(), dataframe[stat].max() - dataframe[stat].min()]
-            for stat in self.get_stat_column_names_from_dataframe(dataframe)
-        }
+    # build meta data similar to the NMS.py mod script to be able to recalaculate perfection for Suit_Jetpack_Ignition Hi/Lo desirability.
+    # the one written by the mod is used if given, in the same order as computed here to keep the exact same results
+    def prepare_ignition_meta(self, dataframe: pandas.DataFrame, meta: typing.Dict[str, typing.List[float]] = None) -> typing.Dict[str, typing.List[float]]:
+        if meta:
+            meta = {stat: list(meta[stat]) for stat in self.get_stat_column_names_from_dataframe(dataframe)}  # copy as it is adjusted below
+        else:
+            meta =  {
+                stat: [dataframe[stat].min(), dataframe[stat].max(), dataframe[stat].max() - dataframe[stat].min()]
+                for stat in self.get_stat_column_names_from_dataframe(dataframe)
+            }
 
-        weighting = [stat[2] + 1 for stat in meta.values()]  # max - min + 1
-        weighting_min = min(weighting)
+            weighting = [stat[2] + 1 for stat in meta.values()]  # max - min + 1
+            weighting_min = min(weighting)
 
-        # add weighting to each stat
-        meta = {key: value + [weighting[i] / weighting_min] for i, (key, value) in enumerate(meta.items())}
+            # add weighting to each stat
+            meta = {key: value + [weighting[i] / weighting_min] for i, (key, value) in enumerate(meta.items())}
 
         # adjust Suit_Jetpack_Ignition as half will be worst desirable now
         meta["Suit_Jetpack_Ignition"][2] /= 2
@@ -819,11 +839,65 @@ class Pi():
 
     # region Pandas
 
-    def get_product_with_pandas(self, item_name) -> pandas.DataFrame:
-        f_name = f"{F_PATH}\\Product\\{item_name}.parquet"
+    # read the Parquet file of an item with the same types and values for all storage profiles. names in separate files
+    # have the same rows in the same order, only those of the given languages are read and put next to the stats. stats
+    # stored as the bonuses of the game are transformed as the mod does it. both before filtering
+    @staticmethod
+    def read_parquet(f_name: str, filters: list = None, languages: typing.List[str] = LANGUAGES) -> pandas.DataFrame:
+        metadata = pq.read_schema(f_name).metadata or {}
+        if metadata.get(b"pi.names") == b"sidecar" or b"pi.transform" in metadata:
+            table = pq.read_table(f_name)
+            for language in (languages if metadata.get(b"pi.names") == b"sidecar" else []):
+                sidecar_f_name = f"{f_name[:-len('.parquet')]}.{RE_LANGUAGE.findall(language)[0]}.parquet"
+                if os.path.isfile(sidecar_f_name):
+                    table = table.append_column(language, pq.read_table(sidecar_f_name, columns=[language]).column(0))
+            for stat, instructions in json.loads(metadata.get(b"pi.transform", b"{}")).items():
+                table = table.set_column(table.schema.get_field_index(stat), stat, pyarrow.array(Pi.transform(table.column(stat).to_numpy(), instructions), from_pandas=True))
+            data = (table.filter(pq.filters_to_expression(filters)) if filters else table).to_pandas()
+        else:
+            data = pandas.read_parquet(f_name, filters=filters)
+        for column in data:
+            if isinstance(data[column].dtype, pandas.CategoricalDtype):  # dictionary-encoded names
+                data[column] = data[column].astype(data[column].dtype.categories.dtype)
+
+        return data
+
+    # transform the bonuses of a stat with the instructions of the mod, in the same order of operands for the same results
+    @staticmethod
+    def transform(column: numpy.ndarray, instructions: list) -> numpy.ndarray:
+        column = numpy.asarray(column, dtype=numpy.float64)
+        for instruction in instructions:
+            if isinstance(instruction[0], str):  # operator first (bonus - 1)
+                column = TRANSFORM_OPERATORS[instruction[0]](column, instruction[1])
+            else:  # operator second (1 - bonus)
+                column = TRANSFORM_OPERATORS[instruction[1]](instruction[0], column)
+
+        return column
+
+    # min, max, range, and weight of each stat as written by the mod, None for files without it
+    @staticmethod
+    def read_meta(f_name: str) -> typing.Optional[typing.Dict[str, typing.List[float]]]:
+        metadata = pq.read_schema(f_name).metadata or {}
+        return json.loads(metadata[b"pi.meta"]) if b"pi.meta" in metadata else None
+
+    # the summary of an item has every seed that is selected here, unless perfection is recalculated
+    def get_parquet_f_name(self, inventory_type: str, item_name: str, all_seeds: bool = False) -> str:
+        f_name = f"{F_PATH}\\{inventory_type}\\{item_name}"
+        if self.summaries and not all_seeds and os.path.isfile(f"{f_name}.summary.parquet"):
+            return f"{f_name}.summary.parquet"
+
+        return f"{f_name}.parquet"
+
+    def get_product_with_pandas(self, item_name, all_seeds: bool = False) -> pandas.DataFrame:
+        f_name = self.get_parquet_f_name("Product", item_name, all_seeds)
         if os.path.isfile(f_name):
-            data = pandas.read_parquet(f_name)
-            return data[data["Perfection"] == 1.0]
+            data = self.read_parquet(f_name, filters=[("Perfection", "==", 1.0)], languages=[self.language])  # only the first row groups if sorted by perfection
+
+            # the summary only has all perfect ones if there are fewer than its top seeds
+            if f_name.endswith(".summary.parquet") and len(data) >= json.loads(pq.read_schema(f_name).metadata[b"pi.summary"])["top"]:
+                return self.get_product_with_pandas(item_name, all_seeds=True)
+
+            return data
 
         return pandas.DataFrame()
 
@@ -833,17 +907,18 @@ class Pi():
         for i, quality in enumerate(qualities, 1):
             item_name = f"{item_id}{quality}"
 
-            f_name = f"{F_PATH}\\{inventory_type}\\{item_name}.parquet"
+            f_name = self.get_parquet_f_name(inventory_type, item_name, all_seeds=item_id == "UP_JET" and quality == "X")
             if not os.path.isfile(f_name):
                 continue
 
-            data = pandas.read_parquet(f_name)
+            data = self.read_parquet(f_name, languages=[self.language])
+            meta = self.read_meta(f_name)
             n = math.floor(3 / i)  # 3 for best, 1 for second
 
             columns = self.get_stat_column_names_from_dataframe(data)
 
             available_stats = len(columns)
-            f_result, max_stats_per_seed, is_all_same = self.get_best_per_stat(data)
+            f_result, max_stats_per_seed, is_all_same = self.get_best_per_stat(data, meta)
 
             if not is_all_same:
                 dataframe_source = data
@@ -854,13 +929,13 @@ class Pi():
                     # * DHarhan: Movemement mods with lowest Initial Boost bonus are just as desirable as highest
                     # low bonus only for X as 4 always has high values
                     if quality == "X":
-                        meta =  self.prepare_ignition_meta(data)
-                        dataframe_source = dataframe_source.assign(Perfection=lambda row: self.calculate_ignition_perfection(meta, row))
+                        ignition_meta = self.prepare_ignition_meta(data, meta)
+                        dataframe_source = dataframe_source.assign(Perfection=lambda row: self.calculate_ignition_perfection(ignition_meta, row))
                         dataframe_desirable = self.remove_undesirable_suit_movement_system_stats(dataframe_source)
 
                         # add 1/3 each for low and high bonus
-                        ignition_l = dataframe_desirable[dataframe_source["Suit_Jetpack_Ignition"] < meta["Suit_Jetpack_Ignition"][4]].sort_values(by=["Perfection", "Seed"], ascending=False).head(n)
-                        ignition_h = dataframe_desirable[dataframe_source["Suit_Jetpack_Ignition"] > meta["Suit_Jetpack_Ignition"][4]].sort_values(by=["Perfection", "Seed"], ascending=False).head(n)
+                        ignition_l = dataframe_desirable[dataframe_source["Suit_Jetpack_Ignition"] < ignition_meta["Suit_Jetpack_Ignition"][4]].sort_values(by=["Perfection", "Seed"], ascending=False).head(n)
+                        ignition_h = dataframe_desirable[dataframe_source["Suit_Jetpack_Ignition"] > ignition_meta["Suit_Jetpack_Ignition"][4]].sort_values(by=["Perfection", "Seed"], ascending=False).head(n)
 
                         f_result = pandas.concat([f_result, ignition_l, ignition_h])
 
@@ -905,6 +980,7 @@ if __name__ == "__main__":
 
     parser.add_argument("-d", "--debug", action="store_true", help="Enable debug mode.")
     parser.add_argument("-l", "--language", choices=[RE_LANGUAGE.findall(l)[0] for l in LANGUAGES], default="en", help="Language to use for procedural names.")
+    parser.add_argument("-s", "--summaries", action="store_true", help="Use the summary of each item instead of all seeds where possible.")
 
     pi = parser.parse_args(namespace=Pi())
 
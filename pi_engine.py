@@ -0,0 +1,2205 @@
+# code shared by PiMod and the offline tools that does not need the running game
+
+import cProfile
+import csv
+import ctypes
+import gc
+import glob
+import importlib.metadata
+import json
+import logging
+import numpy
+import operator
+import os
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import queue
+import random
+import re
+import sqlite3
+import threading
+import time
+import tracemalloc
+
+from array import array
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from functools import partial, reduce
+from typing import Callable, Iterator
+
+
+# region Configuration
+
+TOTAL_SEEDS = 100000
+
+PIPELINE_BATCH_SIZE = 1000  # seeds per message from the thread calling the game to the one processing them
+PIPELINE_QUEUE_SIZE = 16  # messages that can be pending before the thread calling the game has to wait
+
+SUMMARY_TOP = 25  # best seeds of each combination of stats in the summary of an item
+SUMMARY_TOP_PER_STAT = 10  # best seeds of each stat in the summary of an item
+
+ITEM_ORDERS = ["ingame", "shortest", "stalest"]  # how the selected items of each kind are ordered, see CostModel.order()
+
+TRANSFORM = {
+    # region Weapon
+
+    "Weapon_Laser_Damage": [],  # Damage (+???%) > 70.25779724121094
+    "Weapon_Laser_Mining_Speed": [(1, "-"), ("*", 100)],  # Mining Speed (+16%) > 0.8384891152381897 > 16.15108847618103
+    "Weapon_Laser_HeatTime": [("-", 1), ("*", 100)],  # Heat Dispersion (+41%) > 1.407882571220398 > 40.788257122039795
+    "Weapon_Laser_ReloadTime": [(1, "-"), ("*", 100)],  # Overheat Downtime (-15%) > 0.8482741117477417 > 15.17258882522583
+    "Weapon_Laser_Drain": [("-", 1), ("*", 100)],  # Fuel Efficiency (+20%) > 1.2000000476837158 > 20.000004768371582
+    "Weapon_Laser_ChargeTime": [(1, "-"), ("*", 100)],  # Time to Full Power (-19%) > 0.8105689287185669 > 18.94310712814331
+    "Weapon_Projectile_Damage": [],  # Damage (+???%) > 2.270596981048584
+    "Weapon_Projectile_Rate": [("-", 1), ("*", 100)],  # Fire Rate (+13%) > 1.13314688205719 > 13.314688205718994
+    "Weapon_Projectile_ClipSize": [],  # Clip Size (+12.0) > 12.0
+    "Weapon_Projectile_ReloadTime": [(1, "-"), ("*", 100)],  # Reload Time (-6%) > 0.9432281255722046 > 5.677187442779541
+    "Weapon_Projectile_MaximumCharge": [],  # Ion Spheres Created (+1.0) > 1.0
+    "Weapon_Projectile_BurstCap": [],  # Shots Per Burst (+1.0) > 1.0
+    "Weapon_Projectile_BurstCooldown": [(1, "-"), ("*", 100)],  # Burst Cooldown (-19%) > 0.8145824074745178 > 18.541759252548218
+    "Weapon_ChargedProjectile_ChargeTime": [(1, "-"), ("*", 100)],  # Charging Speed (-10%) > 0.8965481519699097 > 10.345184803009033
+    "Weapon_ChargedProjectile_ExtraSpeed": [],  # Ion Sphere Speed (+22%) > 21.99700164794922
+    "Weapon_Grenade_Damage": [],  # Damage (+???%) > 350.14752197265625 > 350.14752197265625
+    "Weapon_Grenade_Radius": [("-", 1), ("*", 100)],  # Explosion Radius (+41%) > 1.407882571220398 > 40.788257122039795
+    "Weapon_Grenade_Speed": [("*", 100)],  # Projectile Velocity (+272%) > 2.7219414710998535 > 272.19414710998535
+    "Weapon_Grenade_Bounce": [],  # Bounce Potential (+???%) > 3.0
+    "Weapon_Scan_Radius": [("-", 1), ("*", 100)],  # Scan Radius (+33%) > 1.3270596265792847 > 32.70596265792847
+    "Weapon_Scan_Discovery_Creature": [("*", 100)],  # Fauna Analysis Rewards (+6,775%) > 67.75889587402344 > 6775.889587402344
+    "Weapon_Scan_Discovery_Flora": [("*", 100)],  # Flora Analysis Rewards (+7,897%) > 78.97901153564453 > 7897.901153564453
+    "Weapon_Scan_Discovery_Mineral": [("*", 100)],  # Mineral Analysis Rewards (+9,026%) > 90.26795196533203 > 9026.795196533203
+    "Weapon_FireDOT_Duration": [("-", 1), ("*", 100)],  # Impact Fire Duration (+27%) > 1.2693740129470825 > 26.93740129470825
+
+    # endregion
+
+    # region Suit
+
+    "Suit_Armour_Health": [],  # Core Health (+???%) > 20.0
+    "Suit_Armour_Shield_Strength": [("*", 100)],  # Shield Strength (+32%) > 0.3216187655925751 > 32.16187655925751
+    "Suit_Energy": [("*", 100)],  # Life Support Tanks (+108%) > 1.0757951736450195 > 107.57951736450195
+    "Suit_Energy_Regen": [("-", 1), ("*", 100)],  # Solar Panel Power (+73%) > 1.7318912744522095 > 73.18912744522095
+    "Suit_Protection_Cold": [],  # Cold Protection (???) > 334.7082214355469
+    "Suit_Protection_Heat": [],  # Heat Protection (???) > 334.7082214355469
+    "Suit_Protection_Toxic": [],  # Toxic Protection (???) > 334.7082214355469
+    "Suit_Protection_Radiation": [],  # Radiation Protection (???) > 334.7082214355469
+    "Suit_Underwater": [],  # Oxygen Tank (???) > 159.639404296875
+    "Suit_DamageReduce_Cold": [(1, "-"), ("*", 100)],  # Cold Damage Shielding (+19%) > 0.8105689287185669 > 18.94310712814331
+    "Suit_DamageReduce_Heat": [(1, "-"), ("*", 100)],  # Heat Damage Shielding (+19%) > 0.8105689287185669 > 18.94310712814331
+    "Suit_DamageReduce_Radiation": [(1, "-"), ("*", 100)],  # Radiation Damage Shielding (+19%) > 0.8105689287185669 > 18.94310712814331
+    "Suit_DamageReduce_Toxic": [(1, "-"), ("*", 100)],  # Toxic Damage Shielding (+19%) > 0.8105689287185669 > 18.94310712814331
+    "Suit_Protection_HeatDrain": [("-", 1), ("*", 100)],  # Heat Resistance (+7%) > 1.0696643590927124 > 6.96643590927124
+    "Suit_Protection_ColdDrain": [("-", 1), ("*", 100)],  # Cold Resistance (+3%) > 1.0343537330627441 > 3.435373306274414
+    "Suit_Protection_ToxDrain": [("-", 1), ("*", 100)],  # Toxic Resistance (+10%) > 1.0958983898162842 > 9.589838981628418
+    "Suit_Protection_RadDrain": [("-", 1), ("*", 100)],  # Radiation Resistance (+2%) > 1.0243568420410156 > 2.4356842041015625
+    "Suit_Stamina_Strength": [("*", 100)],  # Sprint Distance (+43%) > 0.431468665599823 > 43.1468665599823
+    "Suit_Stamina_Recovery": [("-", 1), ("*", 100)],  # Sprint Recovery Time (+38%) > 1.3798800706863403 > 37.98800706863403
+    "Suit_Jetpack_Tank": [("*", 100)],  # Jetpack Tanks (+203%) > 2.0275888442993164 > 202.75888442993164
+    "Suit_Jetpack_Drain": [(1, "-"), ("*", 100)],  # Fuel Efficiency (+6%) > 0.9411903619766235 > 5.8809638023376465
+    "Suit_Jetpack_Refill": [("-", 1), ("*", 100)],  # Recharge Rate (+15%) > 1.1500355005264282 > 15.003550052642822
+    "Suit_Jetpack_Ignition": [("-", 1), ("*", 100)],  # Initial Boost Power (+8%) > 1.0770596265792847 > 7.705962657928467
+
+    # endregion
+
+    # region Ship
+
+    "Ship_Weapons_Guns_Damage": [],  # Damage (+???%) > 6.0000176429748535
+    "Ship_Weapons_Guns_Rate": [("-", 1), ("*", 100)],  # Fire Rate (+6%) > 1.0602484941482544 > 6.0248494148254395
+    "Ship_Weapons_Guns_HeatTime": [("-", 1), ("*", 100)],  # Heat Dispersion (+6%) > 1.0629289150238037 > 6.292891502380371
+    "Ship_Weapons_Lasers_Damage": [],  # Damage (+???%) > 60.02950668334961
+    "Ship_Weapons_Lasers_HeatTime": [("-", 1), ("*", 100)],  # Heat Dispersion (+89%) > 1.8867706060409546 > 88.67706060409546
+    "Ship_Weapons_ShieldLeech": [],  # Shield recharge on impact (+???%) > 0.27219414710998535
+    "Ship_Armour_Shield_Strength": [],  # Shield Strength (+???%) > 0.20000000298023224
+    "Ship_Hyperdrive_JumpDistance": [],  # Hyperdrive Range (251 ly) > 250.77337646484375
+    "Ship_Hyperdrive_JumpsPerCell": [("*", 100)],  # Warp Cell Efficiency (+100%) > 1.0 > 100.0
+    "Ship_Launcher_TakeOffCost": [(1, "-"), ("*", 100)],  # Launch Cost (-20%) > 0.800000011920929 > 19.999998807907104
+    "Ship_Launcher_AutoCharge": [],  # Automatic Recharging (Enabled) > 1.0
+    "Ship_PulseDrive_MiniJumpFuelSpending": [(1, "-"), ("*", 100)],  # Pulse Drive Fuel Efficiency (+20%) > 0.800000011920929 > 19.999998807907104
+    "Ship_Boost": [("-", 1), ("*", 100)],  # Boost (+14%) > 1.1405895948410034 > 14.058959484100342
+    "Ship_Maneuverability": [],  # Maneuverability (???) > 1.006500005722046
+    "Ship_BoostManeuverability": [("-", 1), ("*", 100)],  # Maneuverability (+10%) > 1.1019220352172852 > 10.192203521728516
+
+    # endregion
+
+    # region Freighter
+
+    "Freighter_Hyperdrive_JumpDistance": [],  # Hyperdrive Range (230 ly) > 229.639404296875
+    "Freighter_Hyperdrive_JumpsPerCell": [("*", 100)],  # Warp Cell Efficiency (+100%) > 1.0 > 100.0
+    "Freighter_Fleet_Speed": [("-", 1), ("*", 100)],  # Expedition Speed (+15%) > 1.149999976158142 > 14.999997615814209
+    "Freighter_Fleet_Fuel": [(1, "-"), ("*", 100)],  # Expedition Efficiency (+17%) > 0.8277047276496887 > 17.229527235031128
+    "Freighter_Fleet_Combat": [("-", 1), ("*", 100)],  # Expedition Defenses (+15%) > 1.149999976158142 > 14.999997615814209
+    "Freighter_Fleet_Trade": [("-", 1), ("*", 100)],  # Expedition Trade Ability (+15%) > 1.149999976158142 > 14.999997615814209
+    "Freighter_Fleet_Explore": [("-", 1), ("*", 100)],  # Expedition Scientific Ability (+15%) > 1.149999976158142 > 14.999997615814209
+    "Freighter_Fleet_Mine": [("-", 1), ("*", 100)],  # Expedition Mining Ability (+15%) > 1.149999976158142 > 14.999997615814209
+
+    # endregion
+
+    # region Vehicle
+
+    "Vehicle_EngineFuelUse": [(1, "-"), ("*", 100)],  # Fuel Usage (-28%) > 0.7158533930778503 > 28.414660692214966
+    "Vehicle_EngineTopSpeed": [("-", 1), ("*", 100)],  # Top Speed (+10%) >  1.100000023841858 > 10.000002384185791
+    "Vehicle_BoostSpeed": [("*", 100)],  # Boost Power (+65%) > 0.6525779366493225 > 65.25779366493225
+    "Vehicle_BoostTanks": [("*", 100)],  # Boost Tank Size (+25%) > 0.2501475214958191 > 25.01475214958191
+    "Vehicle_SubBoostSpeed": [("*", 100)],  # Acceleration (+26%) > 0.26352986693382263 > 26.352986693382263
+    "Vehicle_LaserDamage": [],  # Mining Laser Power (+???%) > 36.83852767944336
+    "Vehicle_LaserHeatTime": [(1, "-"), ("*", 100)],   # Mining Laser Efficiency (+19%) > 0.8052845001220703 > 19.47154998779297
+    "Vehicle_GunDamage": [],  # Damage (+???%) > 36.83852767944336
+    "Vehicle_GunHeatTime": [(1, "-"), ("*", 100)],  # Weapon Power Efficiency (+18%) > 0.8241346478462219 > 17.586535215377808
+    "Vehicle_GunRate": [(1, "-"), ("*", 100)],  # Rate of Fire (+9%) > 0.9060062170028687 > 9.399378299713135
+
+    # endregion
+}
+
+TRANSFORM_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+
+def _compile_transform(instructions: list[tuple]):
+    # each step keeps the operand order of its instruction to get the exact same floating point results
+    steps = []
+    for instruction in instructions:
+        if isinstance(instruction[0], str):  # operator first (bonus - 1)
+            steps.append(lambda bonus, op=TRANSFORM_OPERATORS[instruction[0]], value=instruction[1]: op(bonus, value))
+        else:  # operator second (1 - bonus)
+            steps.append(lambda bonus, op=TRANSFORM_OPERATORS[instruction[1]], value=instruction[0]: op(value, bonus))
+
+    # works the same for a single value and an entire NumPy column
+    return reduce(lambda first, second: lambda bonus: second(first(bonus)), steps, lambda bonus: bonus)
+
+
+TRANSFORM_COMPILED = {stat: _compile_transform(instructions) for stat, instructions in TRANSFORM.items()}
+
+# endregion
+
+# region Data
+
+PI_ROOT = os.path.dirname(os.path.realpath(__file__))  # use Pi root directory as starting point
+
+CACHE_ROOT = os.path.join(PI_ROOT, "Cache")  # raw output of the game per version
+
+PRODUCT = [  # ordered by occurrence in GcProceduralProductTable
+    "LOOT",
+    "HIST",
+    "BIO",
+    "FOSS",
+    "PLNT",
+    "TOOL",
+    "FARM",
+    "SEA",
+    "FEAR",
+    "SALV",
+    "BONE",
+    "DARK",
+    "STAR",
+    "EXH",
+
+    # ! No treasure and therefore not really relevant for generating its value.
+    # "PASS",  # FreighterPassword
+    # "CAPT",  # FreighterCaptLog
+    # "CREW",  # FreighterCrewList
+    # "UP_FRHYP",  # FreighterTechHyp
+    # "UP_FRSPE",  # FreighterTechSpeed
+    # "UP_FRFUE",  # FreighterTechFuel
+    # "UP_FRTRA",  # FreighterTechTrade
+    # "UP_FRCOM",  # FreighterTechCombat
+    # "UP_FRMIN",  # FreighterTechMine
+    # "UP_FREXP",  # FreighterTechExp
+    # "LUMP",  # DismantleBio
+    # "COG",   # DismantleTech
+    # "DATA",  # DismantleData
+    # "BOTT",  # MessageInBottle
+]
+
+RE_LANGUAGE = re.compile("\\(([A-Za-z1-9-]+)\\)")
+RE_PRODUCT_AGE = re.compile("([0-9]+)")
+
+STATS_BONUS_DTYPE = numpy.dtype([("Stat", numpy.int32), ("Bonus", numpy.float32), ("Level", numpy.int32)])  # stats of a technology independent of the game version
+
+TECHNOLOGY = {
+    "AlienShip": {
+        "UA_HYP": ["1", "2", "3", "4"],
+        "UA_LAUN": ["1", "2", "3", "4"],
+        "UA_PULSE": ["1", "2", "3", "4"],
+        "UA_S_SHL": ["1", "2", "3", "4"],
+        "UA_SGUN": ["1", "2", "3", "4"],
+        "UA_SLASR": ["1", "2", "3", "4"],
+    },
+    "Exocraft": {
+        "UP_BOOST": ["1", "2", "3", "4"],
+        "UP_EXENG": ["1", "2", "3", "4"],
+        "UP_EXGUN": ["1", "2", "3", "4"],
+        "UP_EXLAS": ["1", "2", "3", "4"],
+    },
+    "Freighter": {
+        "UP_FRCOM": ["1", "2", "3", "4"],
+        "UP_FREXP": ["1", "2", "3", "4"],
+        "UP_FRFUE": ["1", "2", "3", "4"],
+        "UP_FRHYP": ["1", "2", "3", "4"],
+        "UP_FRMIN": ["1", "2", "3", "4"],
+        "UP_FRSPE": ["1", "2", "3", "4"],
+        "UP_FRTRA": ["1", "2", "3", "4"],
+    },
+    "Mech": {
+        "UP_MCENG": ["2", "3", "4"],
+        "UP_MCGUN": ["2", "3", "4"],
+        "UP_MCLAS": ["2", "3", "4"],
+        "UP_MFIRE": ["2", "3", "4"],
+    },
+    "Ship": {
+        "UP_HYP": ["0", "1", "2", "3", "4", "X"],
+        "UP_LAUN": ["0", "1", "2", "3", "4", "X"],
+        "UP_PULSE": ["0", "1", "2", "3", "4", "X"],
+        "UP_S_SHL": ["0", "1", "2", "3", "4", "X"],
+        "UP_SBLOB": ["1", "2", "3", "4", "X"],
+        "UP_SGUN": ["0", "1", "2", "3", "4", "X"],
+        "UP_SLASR": ["1", "2", "3", "4", "X"],
+        "UP_SMINI": ["1", "2", "3", "4", "X"],
+        "UP_SSHOT": ["1", "2", "3", "4", "X"],
+    },
+    "Submarine": {
+        "UP_EXSUB": ["1", "2", "3", "4"],
+        "UP_SUGUN": ["1", "2", "3", "4"],
+    },
+    "Suit": {
+        "UP_COLD": ["1", "2", "3"],
+        "UP_ENGY": ["0", "1", "2", "3", "X"],
+        "UP_HAZ": ["0", "X"],
+        "UP_HOT": ["1", "2", "3"],
+        "UP_JET": ["0", "1", "2", "3", "4", "X"],
+        "UP_RAD": ["1", "2", "3"],
+        "UP_RBSUIT": [""],
+        "UP_SHLD": ["0", "1", "2", "3", "4", "X"],
+        "UP_SNSUIT": [""],
+        "UP_TOX": ["1", "2", "3"],
+        "UP_UNW": ["1", "2", "3"],
+    },
+    "Weapon": {
+        "UP_BOLT": ["0", "1", "2", "3", "4", "X"],
+        "UP_CANN": ["1", "2", "3", "4", "X"],
+        "UP_GREN": ["1", "2", "3", "4", "X"],
+        "UP_LASER": ["0", "1", "2", "3", "4", "X"],
+        "UP_RAIL": ["1", "2", "3", "4", "X"],
+        "UP_SCAN": ["0", "1", "2", "3", "4", "X"],
+        "UP_SENGUN": [""],
+        "UP_SHOT": ["1", "2", "3", "4", "X"],
+        "UP_SMG": ["1", "2", "3", "4", "X"],
+        "UP_TGREN": ["1", "2", "3", "4", "X"],
+    },
+}
+
+
+# lookup array with the name of each stat enum value to get the names of all stats of a seed at once
+def stat_names_array(stat_names: dict[int, str]) -> numpy.ndarray:
+    result = numpy.array([f"Unknown_{value}" for value in range(max(stat_names) + 1)], dtype=object)
+    for value, name in stat_names.items():
+        result[value] = name
+
+    return result
+
+
+# path of the files of an item without extension
+def item_path(inventory_type: str, item_name: str) -> str:
+    return os.path.join(PI_ROOT, inventory_type, item_name)
+
+
+# path of the raw cache of an item without extension
+def cache_path(version: str, inventory_type: str, item_name: str) -> str:
+    return os.path.join(CACHE_ROOT, version, inventory_type, item_name)
+
+
+# selected products as (inventory type, item name) in the same order as in-game, optionally filtered by item id or item name
+def select_products(manual: list = None) -> list[tuple[str, str]]:
+    return [("Product", f"PROC_{item_id}") for item_id in PRODUCT if not manual or any((key in manual) for key in ["PRODUCT", item_id, f"PROC_{item_id}"])]
+
+
+# selected technologies as (inventory type, item name) in the same order as in-game, optionally filtered by inventory type, item id, or item name
+def select_technologies(manual: list = None) -> list[tuple[str, str]]:
+    result = []
+    for inventory_type, items in TECHNOLOGY.items():
+        for item_id, qualities in items.items():
+            for quality in qualities:
+                if not manual or any((key in manual) for key in [inventory_type.upper(), item_id, f"{item_id}{quality}"]):
+                    result.append((inventory_type, f"{item_id}{quality}"))
+
+    return result
+
+
+# endregion
+
+# region Translation
+
+LANGUAGES = [  # order defined by nms_enums.eLanguageRegion
+    "Name (en)",
+    "Name (fr)",
+    "Name (it)",
+    "Name (de)",
+    "Name (es)",
+    "Name (ru)",
+    "Name (pl)",
+    "Name (nl)",
+    "Name (pt)",
+    "Name (es-419)",
+    "Name (pt-BR)",
+    "Name (ja)",
+    "Name (zh-Hans)",
+    "Name (zh-Hant)",
+    "Name (ko)",
+]
+
+LANGUAGES_LEGACY = {  # language codes used in previous versions
+    "Name (zh-Hans)": "Name (zh-CN)",
+    "Name (zh-Hant)": "Name (zh-TW)",
+}
+
+# endregion
+
+# region Helper
+
+
+class _PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        ("cb", ctypes.c_ulong),
+        ("PageFaultCount", ctypes.c_ulong),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+
+# resident memory of the whole process (the game included if running in it) in bytes, 0 if unknown
+def process_memory() -> int:
+    if os.name == "nt":
+        counters = _PROCESS_MEMORY_COUNTERS(cb=ctypes.sizeof(_PROCESS_MEMORY_COUNTERS))
+        kernel32, psapi = ctypes.windll.kernel32, ctypes.windll.psapi
+        kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+        psapi.GetProcessMemoryInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(_PROCESS_MEMORY_COUNTERS), ctypes.c_ulong]
+        if psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return 0
+
+    try:
+        with open("/proc/self/statm", mode="r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+# accumulated seconds of each phase of an item. the producer and the consumer thread time different phases
+class PhaseTimer(object):
+    PHASES = ["game", "map_struct", "name", "row", "transform", "perfection", "csv", "parquet"]
+
+    def __init__(self):
+        self.peak_memory = 0
+        self.seconds = dict.fromkeys(self.PHASES, 0.0)
+        self.seeds = 0
+
+    # add the time since start to a phase and return the new start for the next one.
+    # nested is the result of nested() at start to not count blocks finished in between twice
+    def add(self, phase: str, start: float, nested: float = None) -> float:
+        now = time.perf_counter()
+        self.seconds[phase] += now - start - (self.nested() - nested if nested is not None else 0.0)
+        return now
+
+    def nested(self) -> float:
+        return self.seconds["transform"] + self.seconds["parquet"]
+
+    def sample_memory(self):
+        self.peak_memory = max(self.peak_memory, process_memory())
+
+
+# timing of all items of a run, written next to the data as JSON and CSV
+class RunReport(object):
+    def __init__(self, f_name: str, **info):
+        self.f_name = f_name
+        self.info = {**info, "start_time": datetime.now().isoformat(timespec="seconds")}
+        self.items = []
+        self.lock = threading.Lock()
+
+    def add(self, item_name: str, kind: str, status: str, duration: float, timer: PhaseTimer, stats: int = 0, size: int = 0):
+        row = {
+            "item_name": item_name,
+            "kind": kind,
+            "status": status,
+            "seeds": timer.seeds,
+            "stats": stats,
+            "size": size,
+            "duration": round(duration, 3),
+            "seeds_per_second": round(timer.seeds / duration, 1) if duration else 0.0,
+            "peak_memory_mib": round(timer.peak_memory / 1024 / 1024, 1),
+            **{f"{phase}_seconds": round(seconds, 3) for phase, seconds in timer.seconds.items()},
+        }
+
+        self.lock.acquire()
+        try:
+            self.items.append(row)
+        finally:
+            self.lock.release()
+
+    def write(self):
+        with open(f"{self.f_name}.json", mode="w", encoding="utf-8") as f:
+            json.dump({**self.info, "items": self.items}, f, indent=4)
+
+        with open(f"{self.f_name}.csv", mode="w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(self.items[0].keys()) if self.items else ["item_name"], dialect="excel")
+            writer.writeheader()
+            writer.writerows(self.items)
+
+
+# expected seconds of each item based on earlier runs to order the items and estimate the remaining time.
+# unknown items are estimated by their number of stats or file size, using the average rate of the known ones
+class CostModel(object):
+    DEFAULT_SECONDS = 60.0
+
+    def __init__(self, f_name: str):
+        self.f_name = f_name
+        self.items = {}  # item name to dict with seconds, stats, and size
+
+        if os.path.isfile(f_name):
+            with open(f_name, mode="r", encoding="utf-8") as f:
+                self.items = json.load(f)
+
+    # number of stat columns and size of the existing Parquet file of an item
+    @staticmethod
+    def measure(f_name: str) -> tuple[int, int]:
+        if not os.path.isfile(f"{f_name}.parquet"):
+            return 0, 0
+
+        stat_columns = [name for name in pq.read_schema(f"{f_name}.parquet").names if name not in ["Seed", "Perfection"] and not name.startswith("Name (")]
+        return len(stat_columns), os.path.getsize(f"{f_name}.parquet")
+
+    # modification time of the existing Parquet file of an item, 0 if there is none
+    @staticmethod
+    def modified(f_name: str) -> float:
+        return os.path.getmtime(f"{f_name}.parquet") if os.path.isfile(f"{f_name}.parquet") else 0.0
+
+    def estimate(self, inventory_type: str, item_name: str) -> float:
+        if item_name in self.items:
+            return self.items[item_name]["seconds"]
+
+        if not self.items:
+            return self.DEFAULT_SECONDS
+
+        stats, size = self.measure(item_path(inventory_type, item_name))
+        for key, value in [("stats", stats), ("size", size)]:
+            rates = [item["seconds"] / item[key] for item in self.items.values() if item.get(key)]
+            if value and rates:
+                return sum(rates) / len(rates) * value
+
+        return sum(item["seconds"] for item in self.items.values()) / len(self.items)
+
+    # in-game order, shortest first, or stalest first as items without or with the oldest files are the most likely to have changed
+    def order(self, items: list[tuple[str, str]], order: str) -> list[tuple[str, str]]:
+        if order == "shortest":
+            return sorted(items, key=lambda item: self.estimate(*item))
+        if order == "stalest":
+            return sorted(items, key=lambda item: self.modified(item_path(*item)))
+
+        return list(items)
+
+    # learn from all items that were fully generated in a run, normalized to all seeds as resumed ones only did a part
+    def update(self, report: RunReport):
+        for row in report.items:
+            if row["status"] == "finished" and row["seeds"]:
+                self.items[row["item_name"]] = {
+                    "seconds": round(row["duration"] * TOTAL_SEEDS / row["seeds"], 3),
+                    "stats": row["stats"],
+                    "size": row["size"],
+                }
+
+    def write(self):
+        with open(self.f_name, mode="w", encoding="utf-8") as f:
+            json.dump(self.items, f, indent=4)
+
+
+# version of an installed package, empty if it is not installed the usual way
+def package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+# every run with the timing of its items in a local SQLite database to compare them, e.g. after a game or NMS.py update
+class RunHistory(object):
+    RUN_COLUMNS = ["start_time", "version", "binary_hash", "mod_version"]  # the remaining information of a run is kept as JSON
+    ITEM_COLUMNS = ["item_name", "kind", "status", "seeds", "stats", "size", "duration", "seeds_per_second", "peak_memory_mib"] + [f"{phase}_seconds" for phase in PhaseTimer.PHASES]
+
+    def __init__(self, f_name: str):
+        self.connection = sqlite3.connect(f_name)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute(f"CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY AUTOINCREMENT, {', '.join(self.RUN_COLUMNS)}, info)")
+        self.connection.execute(f"CREATE TABLE IF NOT EXISTS items (run_id INTEGER REFERENCES runs(id), {', '.join(self.ITEM_COLUMNS)})")
+        self.connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.connection.close()
+
+    def record(self, report: RunReport) -> int:
+        info = {key: value for key, value in report.info.items() if key not in self.RUN_COLUMNS}
+        cursor = self.connection.execute(
+            f"INSERT INTO runs ({', '.join(self.RUN_COLUMNS)}, info) VALUES ({', '.join('?' * (len(self.RUN_COLUMNS) + 1))})",
+            [report.info.get(column) for column in self.RUN_COLUMNS] + [json.dumps(info)],
+        )
+        self.connection.executemany(
+            f"INSERT INTO items (run_id, {', '.join(self.ITEM_COLUMNS)}) VALUES ({', '.join('?' * (len(self.ITEM_COLUMNS) + 1))})",
+            [[cursor.lastrowid] + [row.get(column) for column in self.ITEM_COLUMNS] for row in report.items],
+        )
+        self.connection.commit()
+
+        return cursor.lastrowid
+
+    def runs(self) -> list[dict]:
+        return [{**dict(run), "info": json.loads(run["info"])} for run in self.connection.execute("SELECT * FROM runs ORDER BY id")]
+
+    # finished items of a run by name
+    def items(self, run_id: int) -> dict[str, dict]:
+        return {item["item_name"]: dict(item) for item in self.connection.execute("SELECT * FROM items WHERE run_id = ? AND status = 'finished'", [run_id])}
+
+    # seeds per second of all items finished in both runs and, for the ones that dropped by more than the threshold,
+    # the phase whose seconds per seed grew the most
+    def compare(self, baseline_id: int, run_id: int, threshold: float) -> list[dict]:
+        baseline = self.items(baseline_id)
+
+        result = []
+        for item_name, item in self.items(run_id).items():
+            previous = baseline.get(item_name)
+            if not previous or not previous["seeds_per_second"] or not item["seeds"] or not previous["seeds"]:
+                continue
+
+            change = item["seeds_per_second"] / previous["seeds_per_second"] - 1
+            growth = {phase: (item[f"{phase}_seconds"] or 0.0) / item["seeds"] - (previous[f"{phase}_seconds"] or 0.0) / previous["seeds"] for phase in PhaseTimer.PHASES}
+            result.append({
+                "item_name": item_name,
+                "baseline": previous["seeds_per_second"],
+                "latest": item["seeds_per_second"],
+                "change": change,
+                "regressed": change < -threshold,
+                "phase": max(growth, key=growth.get),
+            })
+
+        return result
+
+
+# optional CPU and memory profiles of each item, dumped to a directory per run.
+# producer and consumer are profiled separately as cProfile only sees the thread it is enabled in
+class RunProfiler(object):
+    def __init__(self, directory: str, cpu: bool, memory: bool, top: int = 25):
+        self.cpu = cpu
+        self.directory = directory
+        self.lock = threading.Lock()  # held by the thread that currently profiles
+        self.memory = memory
+        self.profiles = {}  # (item_name, role) to cProfile.Profile
+        self.snapshot = None
+        self.top = top  # number of allocation sites per item
+
+        os.makedirs(directory, exist_ok=True)
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.snapshot = tracemalloc.take_snapshot()
+
+    # profile of a role of an item. Python 3.12+ allows only one active profiler, so while another thread profiles this
+    # part is not measured instead of failing
+    @contextmanager
+    def measure(self, item_name: str, role: str):
+        if not self.cpu or not self.lock.acquire(blocking=False):
+            yield
+            return
+
+        profile = self.profiles.setdefault((item_name, role), cProfile.Profile())
+        try:
+            try:
+                profile.enable()
+            except ValueError:  # another profiling tool is active, e.g. a debugger
+                profile = None
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            self.lock.release()
+
+    # write pstats of each role and the allocation sites that grew the most since the previous item
+    def dump(self, item_name: str):
+        for role in ["producer", "consumer"]:
+            profile = self.profiles.pop((item_name, role), None)
+            if profile:
+                profile.dump_stats(os.path.join(self.directory, f"{item_name}.{role}.pstats"))
+
+        if self.snapshot:
+            snapshot = tracemalloc.take_snapshot()
+            with open(os.path.join(self.directory, f"{item_name}.tracemalloc.txt"), mode="w", encoding="utf-8") as f:
+                for statistic in snapshot.compare_to(self.snapshot, "lineno")[:self.top]:
+                    f.write(f"{statistic}\n")
+            self.snapshot = snapshot
+
+    def close(self):
+        if self.snapshot:
+            tracemalloc.stop()
+            self.snapshot = None
+
+
+# columnar buffer with preallocated arrays for a block of seeds, filled by seed index instead of a dict per seed
+class SeedColumns(object):
+    def __init__(self, size: int, previous_languages: dict[str, list] = None):
+        self.names = {language: numpy.empty(size, dtype=object) for language in LANGUAGES}
+        self.previous_languages = previous_languages or {}
+        self.seed = numpy.empty(size, dtype=numpy.int32)
+        self.size = size
+        self.stats = {}  # in order of first occurrence
+
+        self._unique_names = {}  # procedural names repeat a lot, so keep only one instance of each
+
+        self.clear(0)
+
+    def __len__(self) -> int:
+        return self.length
+
+    # reuse the buffer for the next block of seeds starting at offset
+    def clear(self, offset: int):
+        self.length = 0  # number of seeds actually filled
+        self.offset = offset
+        self.seed[:] = numpy.arange(offset, offset + self.size, dtype=numpy.int32)
+
+        for column in self.stats.values():
+            column.fill(numpy.nan if column.dtype == numpy.float64 else 0)
+
+        # carry over all previous translations
+        for language, column in self.names.items():
+            column.fill("")
+            values = self.previous_languages.get(language, [])[offset:offset + self.size]
+            if isinstance(values, pa.ChunkedArray):  # only the current block is converted to Python strings
+                values = values.to_numpy(zero_copy_only=False)
+            column[:len(values)] = values
+
+    def set_name(self, language: str, index: int, name: str):
+        self.names[language][index] = self._unique_names.setdefault(name, name)
+
+    # get the column of a stat and create it on first occurrence. absent values are NaN
+    def stat(self, name: str, dtype=numpy.float64) -> numpy.ndarray:
+        column = self.stats.get(name)
+        if column is None:
+            fill = numpy.nan if dtype == numpy.float64 else 0  # only floats can be absent
+            column = self.stats[name] = numpy.full(self.size, fill, dtype=dtype)
+
+        return column
+
+    def stat_columns(self) -> dict[str, numpy.ndarray]:
+        return {name: column[:self.length] for name, column in self.stats.items()}
+
+    # table of the filled seeds with the native type of each column
+    def to_table(self) -> pa.Table:
+        columns = {"Seed": pa.array(self.seed[:self.length])}
+        for name, column in self.stat_columns().items():
+            columns[name] = pa.array(column, from_pandas=True)  # NaN becomes null
+        for language, column in self.names.items():
+            columns[language] = pa.array(column[:self.length], type=pa.string())
+
+        return pa.Table.from_arrays(list(columns.values()), names=list(columns.keys()))
+
+
+# how the Parquet files are written. compact keeps the repeating names dictionary-encoded, compresses with zstd in fixed
+# row groups, and stores the bonuses of the game as float32 with their transformation, so readers get the same stats
+@dataclass
+class StorageProfile:
+    name: str
+    name_type: pa.DataType = pa.string()
+    compression: str = "snappy"
+    row_group_size: int = None  # rows per row group, None for one per written block
+    sort_by_perfection: bool = False  # best seeds first with the page index, so reading the top only touches the first row groups
+    sidecar_names: bool = False  # names in one narrow file per language next to the stats, so adding a language only writes its file
+    raw_stats: bool = False  # stats with a transformation as the float32 bonuses of the game, transformed by read_item()
+
+    # same profile with the best seeds first in small row groups
+    def sorted(self, row_group_size: int = 5000) -> "StorageProfile":
+        return replace(self, sort_by_perfection=True, row_group_size=row_group_size)
+
+    def schema(self, stat_columns: list[str], languages: list[str] = LANGUAGES, metadata: dict = None) -> pa.Schema:
+        metadata = dict(metadata or {})
+        if self.name != "default":
+            metadata["pi.storage"] = self.name
+        if self.sort_by_perfection:
+            metadata["pi.layout"] = "perfection"
+        if self.sidecar_names:
+            metadata["pi.names"] = "sidecar"
+        raw_stats = [column for column in stat_columns if self.raw_stats and column in TRANSFORM]
+        if raw_stats:
+            metadata["pi.transform"] = json.dumps({column: TRANSFORM[column] for column in raw_stats})
+
+        return pa.schema(
+            [pa.field('Seed', pa.int32(), nullable=False), pa.field('Perfection', pa.float64(), nullable=False)]
+            +
+            [pa.field(column, pa.float32() if column in raw_stats else pa.float64()) for column in stat_columns]
+            +
+            [pa.field(language, self.name_type, nullable=False) for language in languages],
+            metadata=metadata or None,
+        )
+
+    # stored values of a column of the schema, the transformed stats are taken back to the raw ones
+    def store(self, field: pa.Field, column: pa.ChunkedArray) -> pa.ChunkedArray:
+        if field.type == pa.float32() and self.raw_stats:
+            return pa.chunked_array([pa.array(untransform_column(field.name, column.to_numpy(zero_copy_only=False)), from_pandas=True)], type=field.type)
+
+        return column.cast(field.type)
+
+    def writer(self, f_name: str, schema: pa.Schema) -> pq.ParquetWriter:
+        return pq.ParquetWriter(f_name, schema, compression=self.compression, write_page_index=self.sort_by_perfection)
+
+    # rows in the order of the layout
+    def arrange(self, table: pa.Table) -> pa.Table:
+        return table.sort_by([("Perfection", "descending"), ("Seed", "ascending")] if self.sort_by_perfection else "Seed")
+
+
+STORAGE_PROFILES = {
+    "default": StorageProfile("default"),
+    "compact": StorageProfile("compact", pa.dictionary(pa.int32(), pa.string()), "zstd", 25000, raw_stats=True),
+}
+
+
+def get_storage(name: str, sort_by_perfection: bool = False, sidecar_names: bool = False) -> StorageProfile:
+    storage = STORAGE_PROFILES[name].sorted() if sort_by_perfection else STORAGE_PROFILES[name]
+    return replace(storage, sidecar_names=True) if sidecar_names else storage
+
+
+# Parquet file of an item, or the one next to it with only the names of a language in the sidecar layout
+def parquet_path(f_name: str, language: str = None) -> str:
+    return f"{f_name}.parquet" if language is None else f"{f_name}.{RE_LANGUAGE.findall(language)[0]}.parquet"
+
+
+# same for the CSV files, the ones of the languages have only the seed and its name
+def csv_path(f_name: str, language: str = None) -> str:
+    return f"{f_name}.csv" if language is None else f"{f_name}.{RE_LANGUAGE.findall(language)[0]}.csv"
+
+
+# write the Parquet file of an item, in the sidecar layout the names go to their own file per language. every file gets the
+# same row groups, so readers can put them side by side without copying. all are replaced at once when closed and the
+# existing ones are kept if anything fails
+class ParquetItemWriter(object):
+    def __init__(self, f_name: str, schema: pa.Schema, storage: StorageProfile):
+        languages = [name for name in schema.names if name.startswith("Name (")] if storage.sidecar_names else []
+
+        self.f_name = f_name
+        self.storage = storage
+        self.schemas = {None: pa.schema([field for field in schema if field.name not in languages], metadata=schema.metadata)}
+        self.schemas.update({language: pa.schema([schema.field(language)]) for language in languages})
+        self.writers = {language: storage.writer(f"{parquet_path(f_name, language)}.tmp", self.schemas[language]) for language in self.schemas}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+        for language in self.writers:
+            os.replace(f"{parquet_path(self.f_name, language)}.tmp", parquet_path(self.f_name, language))
+
+        # names of a previous sidecar layout, e.g. before converting back
+        for language in LANGUAGES + list(LANGUAGES_LEGACY.values()):
+            if language not in self.writers and os.path.isfile(parquet_path(self.f_name, language)):
+                os.remove(parquet_path(self.f_name, language))
+
+    # remove the written files without touching the existing ones
+    def discard(self):
+        for language, writer in self.writers.items():
+            writer.close()
+            if os.path.isfile(f"{parquet_path(self.f_name, language)}.tmp"):
+                os.remove(f"{parquet_path(self.f_name, language)}.tmp")
+
+    def write_table(self, table: pa.Table):
+        for language, writer in self.writers.items():
+            writer.write_table(table.select(self.schemas[language].names), row_group_size=self.storage.row_group_size)
+
+
+# small excerpt of an item with every seed a reader is expected to select. these are the best ones of each combination of
+# stats (so any selection by present or absent stats is covered), the best ones of each stat, and the last one
+class SummaryBuilder(object):
+    def __init__(self, top: int = SUMMARY_TOP, top_per_stat: int = SUMMARY_TOP_PER_STAT):
+        self.candidates = []  # excerpt of each block, the excerpt of all of them is taken at the end
+        self.top = top
+        self.top_per_stat = top_per_stat
+
+    def add(self, table: pa.Table):
+        self.candidates.append(self.select(table))
+
+    def select(self, table: pa.Table) -> pa.Table:
+        seed = table.column("Seed").to_numpy()
+        perfection = table.column("Perfection").to_numpy()
+        stats = {name: table.column(name).to_numpy(zero_copy_only=False) for name in table.column_names if name not in ["Seed", "Perfection"] and not name.startswith("Name (")}
+
+        # best first by perfection and seed, both descending like the readers sort
+        order = numpy.lexsort((seed, perfection))[::-1]
+
+        combination = numpy.zeros(len(table), dtype=numpy.int64)
+        for i, column in enumerate(stats.values()):
+            combination |= (~numpy.isnan(column)).astype(numpy.int64) << i
+
+        result = [numpy.argmax(seed, keepdims=True)]
+        for value in numpy.unique(combination):
+            result.append(order[combination[order] == value][:self.top])
+        for column in stats.values():
+            present = numpy.flatnonzero(~numpy.isnan(column))
+            result.append(present[numpy.lexsort((seed[present], perfection[present], column[present]))[::-1][:self.top_per_stat]])
+
+        indices = numpy.unique(numpy.concatenate(result))
+        return table.take(indices[numpy.argsort(seed[indices])])
+
+    def table(self) -> pa.Table:
+        return self.select(pa.concat_tables(self.candidates))
+
+    def write(self, f_name: str, storage: StorageProfile):
+        table = self.table()
+        metadata = {key: value for key, value in (table.schema.metadata or {}).items() if key != b"pi.layout"}  # always in seed order
+        table = table.replace_schema_metadata({**metadata, b"pi.summary": json.dumps({"top": self.top, "top_per_stat": self.top_per_stat}).encode()})
+        pq.write_table(table, f"{f_name}.summary.parquet", compression=storage.compression)
+
+
+# write the CSV and Parquet file of an item at once or block by block. each block becomes a row group.
+# sorted by perfection, the Parquet file can only be written at the end while the CSV stays in seed order.
+# the existing files are only replaced once all are written, so a failure keeps them as they were. in the sidecar layout
+# the CSV is split the same way as the Parquet file
+class ResultWriter(object):
+    def __init__(self, f_name: str, meta: dict, timer: PhaseTimer = None, storage: StorageProfile = STORAGE_PROFILES["default"], metadata: dict = None):
+        self.f_name = f_name
+        self.timer = timer or PhaseTimer()
+        self.fieldnames = {None: ["Seed", "Perfection"] + sorted(meta.keys()) + ([] if storage.sidecar_names else LANGUAGES)}  # of each CSV file
+        if storage.sidecar_names:
+            self.fieldnames.update({language: ["Seed", language] for language in LANGUAGES})
+        self.storage = storage
+        self.schema = storage.schema(list(meta.keys()), metadata=metadata)
+        self.summary = SummaryBuilder()
+        self.tables = []  # all blocks if sorted
+
+    def __enter__(self):
+        self.csv_files = {}
+        self.csv_writers = {}
+        for language, fieldnames in self.fieldnames.items():
+            self.csv_files[language] = open(f"{csv_path(self.f_name, language)}.tmp", mode="w", encoding="utf-8", newline="")
+            self.csv_files[language].write("sep=,\r\n")
+            self.csv_writers[language] = csv.writer(self.csv_files[language], dialect="excel")
+            self.csv_writers[language].writerow(fieldnames)
+        self.parquet_writer = ParquetItemWriter(self.f_name, self.schema, self.storage)
+        return self
+
+    def __exit__(self, exc_type, *args):
+        for csv_file in self.csv_files.values():
+            csv_file.close()
+        if exc_type is not None:
+            self.discard()
+            return
+
+        try:
+            if self.tables:
+                start = time.perf_counter()
+                self.parquet_writer.write_table(self.storage.arrange(pa.concat_tables(self.tables)))
+                self.timer.add("parquet", start)
+        except Exception:
+            self.discard()
+            raise
+
+        self.parquet_writer.close()
+        for language in self.csv_files:
+            os.replace(f"{csv_path(self.f_name, language)}.tmp", csv_path(self.f_name, language))
+
+        # names of a previous sidecar layout
+        for language in LANGUAGES + list(LANGUAGES_LEGACY.values()):
+            if language not in self.csv_files and os.path.isfile(csv_path(self.f_name, language)):
+                os.remove(csv_path(self.f_name, language))
+
+        start = time.perf_counter()
+        self.summary.write(self.f_name, self.storage)
+        self.timer.add("parquet", start)
+
+    # remove the written files without touching the existing ones
+    def discard(self):
+        self.parquet_writer.discard()
+        for language in self.csv_files:
+            os.remove(f"{csv_path(self.f_name, language)}.tmp")
+
+    def write(self, table: pa.Table, perfection: numpy.ndarray):
+        columns = {name: table.column(name) for name in table.column_names}
+        columns["Perfection"] = pa.array(perfection)
+
+        # stats that first occurred in a later block are absent in earlier ones
+        for field in self.schema:
+            if field.name not in columns:
+                columns[field.name] = pa.nulls(len(table), type=field.type)
+
+        # CSV with native values, e.g. integers stay integers and null becomes an empty cell
+        start = time.perf_counter()
+        values = {fieldname: columns[fieldname].to_pylist() for fieldnames in self.fieldnames.values() for fieldname in fieldnames}
+        for language, csv_writer in self.csv_writers.items():
+            csv_writer.writerows(zip(*(values[fieldname] for fieldname in self.fieldnames[language])))
+        start = self.timer.add("csv", start)
+
+        # Parquet
+        table = pa.Table.from_arrays([self.storage.store(field, columns[field.name]) for field in self.schema], schema=self.schema)
+        self.summary.add(transform_stats(table))  # from the stored values to select the same as readers do
+        if self.storage.sort_by_perfection:
+            self.tables.append(table)
+        else:
+            self.parquet_writer.write_table(table)
+        self.timer.add("parquet", start)
+
+
+# stream blocks of seeds into temporary Parquet files while generating. a new part is started whenever the columns change (e.g. a new stat occurs)
+class StreamingResult(object):
+    def __init__(self, f_name: str):
+        self.f_name = f_name
+        self.parts = []
+        self.writer = None
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+    def write(self, table: pa.Table):
+        if self.writer is None or not table.schema.equals(self.writer.schema):
+            self.close()
+            self.parts.append(f"{self.f_name}.part{len(self.parts)}.parquet")
+            self.writer = pq.ParquetWriter(self.parts[-1], table.schema)
+
+        self.writer.write_table(table)
+
+    # finish the current part to make all written blocks durable
+    def checkpoint(self) -> list[str]:
+        self.close()
+        return list(self.parts)
+
+    # number of seeds in all written blocks
+    def rows(self) -> int:
+        self.close()
+        return sum(pq.read_metadata(part).num_rows for part in self.parts)
+
+    # read all blocks again in order of their seeds
+    def read(self):
+        self.close()
+        for part in self.parts:
+            parquet_file = pq.ParquetFile(part)
+            for i in range(parquet_file.num_row_groups):
+                yield parquet_file.read_row_group(i)
+
+    def remove(self):
+        self.close()
+        for part in self.parts:
+            if os.path.isfile(part):
+                os.remove(part)
+        self.parts = []
+
+
+# durable progress of each item to be able to resume an interrupted generation
+class Checkpoint(object):
+    def __init__(self, f_name: str):
+        self.f_name = f_name
+        self.items = {}
+        self.lock = threading.Lock()
+
+        if os.path.isfile(f_name):
+            with open(f_name, mode="r", encoding="utf-8") as f:
+                self.items = json.load(f)
+
+    # get progress of an item but only if it was made with the same game version and language
+    def get(self, item_name: str, version: str, language: str) -> dict:
+        record = self.items.get(item_name, {})
+        if record.get("version") == version and record.get("language") == language:
+            return record
+
+        return {}
+
+    def remove(self, item_name: str):
+        self.update(item_name, None)
+
+    def update(self, item_name: str, record: dict):
+        self.lock.acquire()
+        try:
+            if record is None:
+                self.items.pop(item_name, None)
+            else:
+                self.items[item_name] = record
+
+            # write to a temporary file first to not lose everything if the game crashes while writing
+            with open(f"{self.f_name}.tmp", mode="w", encoding="utf-8") as f:
+                json.dump(self.items, f, indent=4)
+            os.replace(f"{self.f_name}.tmp", self.f_name)
+        finally:
+            self.lock.release()
+
+
+# endregion
+
+# region Transform
+
+
+# get compiled transformation of a stat. unknown stats are kept as they are and only reported once
+def get_transform(stat):
+    transform = TRANSFORM_COMPILED.get(stat)
+    if transform is None:
+        logging.warning(f"     > not in TRANSFORM > {stat}")
+        transform = TRANSFORM_COMPILED[stat] = _compile_transform([])
+
+    return transform
+
+
+# transform raw value to look more like in-game
+def transform_value(stat, bonus):
+    return get_transform(stat)(bonus)
+
+
+# transform an entire column of raw values (e.g. float32 as in the game) at once. NaN stays NaN
+def transform_column(stat, column: numpy.ndarray) -> numpy.ndarray:
+    return get_transform(stat)(numpy.asarray(column, dtype=numpy.float64))
+
+
+TRANSFORM_INVERSE = {
+    "+": operator.sub,
+    "-": operator.add,
+    "*": operator.truediv,
+    "/": operator.mul,
+}
+
+
+# raw float32 values of a transformed column by going through the instructions backwards. a value that does not transform
+# back to exactly the same one cannot be stored raw
+def untransform_column(stat, column: numpy.ndarray) -> numpy.ndarray:
+    raw = numpy.asarray(column, dtype=numpy.float64)
+    for instruction in reversed(TRANSFORM.get(stat, [])):
+        if isinstance(instruction[0], str):  # operator first (bonus - 1)
+            raw = TRANSFORM_INVERSE[instruction[0]](raw, instruction[1])
+        elif instruction[1] in ["+", "*"]:  # operator second but commutative (1 + bonus)
+            raw = TRANSFORM_INVERSE[instruction[1]](raw, instruction[0])
+        else:  # operator second (1 - bonus), its own inverse
+            raw = TRANSFORM_OPERATORS[instruction[1]](instruction[0], raw)
+    raw = raw.astype(numpy.float32)
+
+    mismatch = transform_column(stat, raw) != column
+    if numpy.any(mismatch & ~numpy.isnan(column)):
+        raise ValueError(f"{stat} cannot be stored as float32 bonuses, e.g. {column[mismatch & ~numpy.isnan(column)][0]}")
+
+    return raw
+
+
+# table with the stats as written by the builders, those stored raw are transformed with their instructions in the metadata
+def transform_stats(table: pa.Table) -> pa.Table:
+    metadata = table.schema.metadata or {}
+    if b"pi.transform" not in metadata:
+        return table
+
+    for stat, instructions in json.loads(metadata[b"pi.transform"]).items():
+        i = table.schema.get_field_index(stat)
+        if i >= 0:
+            column = _compile_transform(instructions)(numpy.asarray(table.column(i).to_numpy(), dtype=numpy.float64))
+            table = table.set_column(i, pa.field(stat, pa.float64()), pa.array(column, from_pandas=True))
+
+    return table.replace_schema_metadata({key: value for key, value in metadata.items() if key != b"pi.transform"})
+
+
+# endregion
+
+# region Perfection
+
+
+# add range and weighting to the min/max of each stat
+def calculate_meta(limits: dict[str, list]) -> dict[str, list]:
+    weighting = [stat[1] - stat[0] + 1 for stat in limits.values()]  # max - min + 1
+    weighting_min = min(weighting)
+
+    return {key: value + [value[1] - value[0], weighting[i] / weighting_min] for i, (key, value) in enumerate(limits.items())}
+
+
+# calculate the weighted perfection of all given seeds at once. all columns are aligned by seed and use NaN for absent stats
+def calculate_perfection(meta: dict[str, list], columns: dict[str, numpy.ndarray], number: int) -> numpy.ndarray:
+    size = len(next(iter(columns.values())))
+    perfection = numpy.zeros(size)
+    weighting_total = numpy.zeros(size)
+    count = numpy.zeros(size, dtype=numpy.int64)
+
+    # accumulate stat by stat in order of meta to keep the exact same floating point results as summing per seed
+    for stat_name, stat_meta in meta.items():
+        column = columns.get(stat_name)
+        if column is None:  # stat does not occur in these seeds at all
+            continue
+
+        present = ~numpy.isnan(column)
+        weight = stat_meta[3]
+
+        p = numpy.ones(size)
+        if stat_meta[2] > 0:
+            p -= (stat_meta[1] - column) / stat_meta[2]
+
+        perfection[present] += p[present] * weight
+        weighting_total[present] += weight
+        count[present] += 1
+
+    return (perfection / weighting_total) * (count / number)
+
+
+def calculate_product_perfection(meta: list, value: numpy.ndarray) -> numpy.ndarray:
+    return 1.0 - (meta[1] - value) / (meta[1] - meta[0])
+
+
+# endregion
+
+# region Read/Write
+
+
+def extract_previous_languages(existing) -> dict:
+    if isinstance(existing, pa.Table):
+        result = {}
+        for language in LANGUAGES:
+            column = existing.column(language) if language in existing.column_names else None
+
+            # get previous translations with a legacy language code if empty
+            legacy = LANGUAGES_LEGACY.get(language)
+            if legacy in existing.column_names:
+                column = existing.column(legacy) if column is None else pc.if_else(pc.equal(column, ""), existing.column(legacy), column)
+
+            if column is not None:
+                result[language] = column.fill_null("")
+
+        return result
+
+    # add all languages and get previous translations or empty string
+    return {
+        language: [row.get(language, "") or row.get(LANGUAGES_LEGACY.get(language), "") or "" for row in existing]
+        for language in LANGUAGES
+    }
+
+
+# read existing file to carry over all previous translations. only the name columns of Parquet are read, CSV is kept for older files
+def read_existing_file(f_name: str):
+    if os.path.isfile(f"{f_name}.parquet"):
+        table = read_item(f_name, ["Seed"] + LANGUAGES + list(LANGUAGES_LEGACY.values())).sort_by("Seed").drop_columns(["Seed"])  # sorted ones are not in seed order
+        return table.cast(pa.schema([pa.field(field.name, pa.string(), field.nullable) for field in table.schema]))  # compact ones are dictionary-encoded
+
+    if os.path.isfile(f"{f_name}.csv"):
+        with open(f"{f_name}.csv", mode="r", encoding="utf-8", newline="") as f:
+            f.readline()  # skip first line with delimiter indicator
+            reader = csv.DictReader(f, dialect="excel")
+            return list(reader)
+
+    return []
+
+
+def is_sorted_by_perfection(schema: pa.Schema) -> bool:
+    return (schema.metadata or {}).get(b"pi.layout") == b"perfection"
+
+
+def has_sidecar_names(schema: pa.Schema) -> bool:
+    return (schema.metadata or {}).get(b"pi.names") == b"sidecar"
+
+
+# table of an item, optionally only some columns and row groups. in the sidecar layout the names of each language are put
+# next to the stats as they have the same rows in the same row groups, so nothing is joined or copied. stats stored raw
+# are transformed
+def read_item(f_name: str, columns: list[str] = None, row_groups: list[int] = None) -> pa.Table:
+    with pq.ParquetFile(parquet_path(f_name)) as parquet_file:
+        schema = parquet_file.schema_arrow
+        read_columns = None if columns is None else [name for name in columns if name in schema.names]
+        table = parquet_file.read(read_columns) if row_groups is None else parquet_file.read_row_groups(row_groups, read_columns)
+
+    if has_sidecar_names(schema):
+        for language in LANGUAGES + list(LANGUAGES_LEGACY.values()):
+            if (columns is None or language in columns) and os.path.isfile(parquet_path(f_name, language)):
+                with pq.ParquetFile(parquet_path(f_name, language)) as parquet_file:
+                    names = parquet_file.read() if row_groups is None else parquet_file.read_row_groups(row_groups)
+                table = table.append_column(names.schema.field(0), names.column(0))
+
+    return transform_stats(table)
+
+
+# best seeds of an item, the top n and/or those with at least a perfection. files sorted by perfection are only read
+# until the row group that cannot contribute anymore, others are read entirely
+def read_best(f_name: str, n: int = None, min_perfection: float = None, columns: list[str] = None) -> pa.Table:
+    read_columns = None if columns is None else list(dict.fromkeys(["Perfection", "Seed"] + columns))
+
+    row_groups = None  # all
+    with pq.ParquetFile(f"{f_name}.parquet") as parquet_file:
+        if is_sorted_by_perfection(parquet_file.schema_arrow):
+            perfection = parquet_file.schema_arrow.get_field_index("Perfection")
+            row_groups = []
+            rows = 0
+            for i in range(parquet_file.num_row_groups):
+                statistics = parquet_file.metadata.row_group(i).column(perfection).statistics
+                if (n is not None and rows >= n) or (min_perfection is not None and statistics is not None and statistics.has_min_max and statistics.max < min_perfection):
+                    break
+
+                row_groups.append(i)
+                rows += parquet_file.metadata.row_group(i).num_rows
+
+    table = read_item(f_name, read_columns, row_groups)
+    if row_groups is None:
+        table = table.sort_by([("Perfection", "descending"), ("Seed", "ascending")])
+
+    if min_perfection is not None:
+        table = table.filter(pc.field("Perfection") >= min_perfection)
+    if n is not None:
+        table = table.slice(0, n)
+
+    return table if columns is None else table.select(columns)
+
+
+# replace the names of a language in a Parquet file, keeping its storage profile, e.g. dictionary-encoded names
+def write_parquet_names(parquet_f_name: str, language: str, names: numpy.ndarray):
+    with pq.ParquetFile(parquet_f_name) as parquet_file:
+        compression = parquet_file.metadata.row_group(0).column(0).compression.lower()
+        row_group_size = parquet_file.metadata.row_group(0).num_rows
+        table = parquet_file.read()
+
+    name_type = next((field.type for field in table.schema if field.name.startswith("Name (")), pa.string())
+    column = pa.array(names[table.column("Seed").to_numpy()], type=pa.string()).cast(name_type)  # by seed in case rows are not in order
+    i = table.schema.get_field_index(language)
+    if i < 0:
+        table = table.append_column(pa.field(language, name_type, nullable=False), column)
+    else:
+        table = table.set_column(i, table.schema.field(i), column)
+
+    pq.write_table(table, f"{parquet_f_name}.tmp", row_group_size=row_group_size, compression=compression, write_page_index=is_sorted_by_perfection(table.schema))
+    os.replace(f"{parquet_f_name}.tmp", parquet_f_name)  # the existing file stays intact if writing fails
+
+
+# write the names of a language of the sidecar layout, in the row order and row groups of the Parquet file with the stats
+def write_sidecar_names(f_name: str, language: str, names: numpy.ndarray):
+    with pq.ParquetFile(f"{f_name}.parquet") as parquet_file:
+        compression = parquet_file.metadata.row_group(0).column(0).compression.lower()
+        row_groups = [parquet_file.metadata.row_group(i).num_rows for i in range(parquet_file.num_row_groups)]
+        seed = parquet_file.read(["Seed"]).column("Seed").to_numpy()
+        storage = STORAGE_PROFILES.get((parquet_file.schema_arrow.metadata or {}).get(b"pi.storage", b"default").decode(), STORAGE_PROFILES["default"])
+
+    field = pa.field(language, storage.name_type, nullable=False)
+    table = pa.table([pa.array(names[seed], type=pa.string()).cast(field.type)], schema=pa.schema([field]))
+    with pq.ParquetWriter(f"{parquet_path(f_name, language)}.tmp", table.schema, compression=compression) as writer:
+        offset = 0
+        for rows in row_groups:
+            writer.write_table(table.slice(offset, rows), row_group_size=rows)
+            offset += rows
+    os.replace(f"{parquet_path(f_name, language)}.tmp", parquet_path(f_name, language))
+
+
+def read_csv_header(csv_f_name: str) -> list[str]:
+    with open(csv_f_name, mode="r", encoding="utf-8", newline="") as f:
+        f.readline()  # skip first line with delimiter indicator
+        return next(csv.reader(f, dialect="excel"), [])
+
+
+# replace the names of a language in the existing files without touching anything else
+def write_names(f_name: str, language: str, names: numpy.ndarray):
+    sidecar = os.path.isfile(f"{f_name}.parquet") and has_sidecar_names(pq.read_schema(f"{f_name}.parquet"))
+
+    # Parquet, in the sidecar layout only the file of the language is written
+    if sidecar:
+        write_sidecar_names(f_name, language, names)
+    elif os.path.isfile(f"{f_name}.parquet"):
+        write_parquet_names(f"{f_name}.parquet", language, names)
+
+    # summary, always with the names
+    if os.path.isfile(f"{f_name}.summary.parquet"):
+        write_parquet_names(f"{f_name}.summary.parquet", language, names)
+
+    # CSV, in the sidecar layout only the file of the language unless the names are still in the one with the stats (e.g.
+    # right after converting the Parquet file)
+    if sidecar and os.path.isfile(f"{f_name}.csv") and language not in read_csv_header(f"{f_name}.csv"):
+        with open(f"{csv_path(f_name, language)}.tmp", mode="w", encoding="utf-8", newline="") as f:
+            f.write("sep=,\r\n")
+            writer = csv.writer(f, dialect="excel")
+            writer.writerow(["Seed", language])
+            writer.writerows(enumerate(names))
+        os.replace(f"{csv_path(f_name, language)}.tmp", csv_path(f_name, language))
+
+    # CSV, all other values are kept as they are
+    elif os.path.isfile(f"{f_name}.csv"):
+        with open(f"{f_name}.csv", mode="r", encoding="utf-8", newline="") as f:
+            f.readline()  # skip first line with delimiter indicator
+            rows = list(csv.reader(f, dialect="excel"))
+
+        if language not in rows[0]:
+            rows[0].append(language)
+            for row in rows[1:]:
+                row.append("")
+
+        i = rows[0].index(language)
+        for row in rows[1:]:
+            row[i] = names[int(row[0])]
+
+        with open(f"{f_name}.csv.tmp", mode="w", encoding="utf-8", newline="") as f:
+            f.write("sep=,\r\n")
+            writer = csv.writer(f, dialect="excel")
+            writer.writerows(rows)
+        os.replace(f"{f_name}.csv.tmp", f"{f_name}.csv")
+
+
+def write_result(f_name: str, meta: dict, table: pa.Table, perfection: numpy.ndarray, timer: PhaseTimer = None, storage: StorageProfile = STORAGE_PROFILES["default"], metadata: dict = None):
+    with ResultWriter(f_name, meta, timer, storage, metadata) as writer:
+        writer.write(table, perfection)
+
+
+# write the final files from all streamed blocks in a final pass as perfection is only known after all seeds are seen
+def write_streamed_result(f_name: str, meta: dict, stream: StreamingResult, calculate_perfection, timer: PhaseTimer = None, storage: StorageProfile = STORAGE_PROFILES["default"], metadata: dict = None):
+    with ResultWriter(f_name, meta, timer, storage, metadata) as writer:
+        for table in stream.read():
+            writer.write(table, calculate_perfection(table))
+
+    stream.remove()
+
+
+# rewrite the Parquet file of an item with another storage profile, to the given file or in place. the CSV is not touched
+def convert_storage(f_name: str, storage: StorageProfile, target: str = None):
+    table = storage.arrange(read_item(f_name))
+    languages = [name for name in table.column_names if name.startswith("Name (")]
+    stat_columns = [name for name in table.column_names if name not in ["Seed", "Perfection"] + languages]
+    metadata = {key.decode(): value.decode() for key, value in (table.schema.metadata or {}).items() if key.startswith(b"pi.") and key not in [b"pi.layout", b"pi.names", b"pi.storage"]}  # written by Pi, e.g. meta
+    schema = storage.schema(stat_columns, languages, metadata)
+
+    table = pa.Table.from_arrays([storage.store(field, table.column(field.name)) for field in schema], schema=schema)
+    with ParquetItemWriter(target or f_name, schema, storage) as writer:
+        writer.write_table(table)
+
+    # the summary is taken from the stored values
+    summary = SummaryBuilder()
+    summary.add(transform_stats(table))
+    summary.write(target or f_name, storage)
+
+
+# endregion
+
+# region Builder
+
+
+# build the files of an item seed by seed from generated values, the same way in-game and offline
+class ItemBuilder(object):
+    def __init__(self, f_name: str, block_size: int = 0, progress: dict = None, save_progress=None, previous_languages: dict = None):
+        if previous_languages is None:
+            previous_languages = extract_previous_languages(read_existing_file(f_name))
+
+        streaming = 0 < block_size < TOTAL_SEEDS  # write blocks to temporary files to bound the memory usage
+        self.f_name = f_name
+        self.result = SeedColumns(block_size if streaming else TOTAL_SEEDS, previous_languages)  # result for each seed
+        self.save_progress = save_progress  # called with the progress after each written block
+        self.storage = STORAGE_PROFILES["default"]  # of the final Parquet file
+        self.version = None  # game version recorded in the Parquet file
+        self.stream = StreamingResult(f_name) if streaming else None
+        self.timer = PhaseTimer()
+
+        # continue after the last written block
+        if progress:
+            self.stream.parts = progress["parts"]
+            self.result.clear(progress["seeds"])
+
+    # first seed that still needs to be added
+    @property
+    def offset(self) -> int:
+        return self.result.offset
+
+    # index of a seed in the current block. the name is only set if a language is given, otherwise the previous one is kept
+    def start_seed(self, seed: int, language: str, name: str) -> int:
+        i = seed - self.result.offset
+        if language:
+            self.result.set_name(language, i, name)
+
+        return i
+
+    def end_seed(self, seed: int):
+        self.result.length = seed - self.result.offset + 1
+
+        if self.stream and len(self.result) == self.result.size:
+            self.finish_block()
+            start = time.perf_counter()
+            self.stream.write(self.result.to_table())
+            self.timer.add("parquet", start)
+            self.result.clear(seed + 1)
+            if self.save_progress:
+                self.save_progress(seeds=seed + 1, **self.progress(), parts=self.stream.checkpoint())
+
+    # remove temporary files of an item that cannot be finished
+    def discard(self):
+        if self.stream:
+            self.stream.remove()
+
+    # keep temporary files of an item that is cancelled to continue it later
+    def close(self):
+        if self.stream:
+            self.stream.close()
+
+    # add the raw values of a seed as returned by the backend method of the same name as kind
+    def add_raw(self, seed: int, language: str, raw: tuple, stat_names: numpy.ndarray):
+        raise NotImplementedError
+
+    def finish_block(self):
+        pass
+
+    def meta(self) -> dict:
+        raise NotImplementedError
+
+    def perfection(self, meta: dict, columns: dict[str, numpy.ndarray]) -> numpy.ndarray:
+        raise NotImplementedError
+
+    def progress(self) -> dict:
+        raise NotImplementedError
+
+    # key-value metadata of the Parquet file, so readers do not have to scan the columns for what is known here anyway.
+    # called once all blocks are streamed
+    def metadata(self, meta: dict) -> dict[str, str]:
+        result = {"pi.rows": str(self.stream.rows() if self.stream else len(self.result))}  # seeds actually written
+        if self.version:
+            result["pi.version"] = self.version
+
+        return result
+
+    def write(self):
+        self.finish_block()
+        meta = self.meta()
+
+        if self.stream:
+            if len(self.result):
+                self.stream.write(self.result.to_table())
+
+            try:
+                write_streamed_result(self.f_name, meta, self.stream, lambda table: self.timed_perfection(meta, {name: table.column(name).to_numpy() for name in meta if name in table.column_names}), self.timer, self.storage, self.metadata(meta))
+            except Exception:
+                if not self.save_progress:  # blocks are only kept if a checkpoint can resume them
+                    self.stream.remove()
+                raise
+        else:
+            write_result(self.f_name, meta, self.result.to_table(), self.timed_perfection(meta, self.result.stat_columns()), self.timer, self.storage, self.metadata(meta))
+
+    def timed_perfection(self, meta: dict, columns: dict[str, numpy.ndarray]) -> numpy.ndarray:
+        start = time.perf_counter()
+        result = self.perfection(meta, columns)
+        self.timer.add("perfection", start)
+
+        return result
+
+
+class ProductBuilder(ItemBuilder):
+    kind = "product"
+
+    def __init__(self, f_name: str, block_size: int = 0, progress: dict = None, save_progress=None, previous_languages: dict = None):
+        super().__init__(f_name, block_size, progress, save_progress, previous_languages)
+        self.limits = progress["meta"] if progress else []  # keep track of min/max for perfection calculation
+
+        self.age = self.result.stat("Age", numpy.int32)
+        self.value = self.result.stat("Value", numpy.int32)
+
+    def add(self, seed: int, language: str, name: str, age: int, value: int):
+        i = self.start_seed(seed, language, name)
+
+        self.age[i] = age
+        self.value[i] = value
+
+        # update to track meta values
+        if not self.limits:
+            logging.debug(f"     > Age > {age}")
+            logging.debug(f"     > Value > {value}")
+            self.limits = [value, value]
+        else:
+            self.limits = [
+                min(self.limits[0], value),
+                max(self.limits[1], value),
+            ]
+
+        self.end_seed(seed)
+
+    def add_raw(self, seed: int, language: str, raw: tuple, stat_names: numpy.ndarray):
+        name, age, value = raw
+        self.add(seed, language, name, age, value)
+
+    def meta(self) -> dict:
+        return {"Age": None, "Value": None}
+
+    def perfection(self, meta: dict, columns: dict[str, numpy.ndarray]) -> numpy.ndarray:
+        return calculate_product_perfection(self.limits, columns["Value"])
+
+    def metadata(self, meta: dict) -> dict[str, str]:
+        return {**super().metadata(meta), "pi.meta": json.dumps(calculate_meta({"Value": self.limits}))}
+
+    def progress(self) -> dict:
+        return {"meta": self.limits}
+
+
+class TechnologyBuilder(ItemBuilder):
+    kind = "technology"
+
+    def __init__(self, f_name: str, block_size: int = 0, progress: dict = None, save_progress=None, previous_languages: dict = None):
+        super().__init__(f_name, block_size, progress, save_progress, previous_languages)
+        self.limits = progress["limits"] if progress else {}  # keep track of min/max for perfection calculation
+        self.number = progress["number"] if progress else 0  # maximum number of unique stats per seed
+        self.columns_by_stat = None  # column of the result of each stat enum value, None before its first occurrence
+
+    def add(self, seed: int, language: str, name: str, bonuses: list[tuple[str, float]]):
+        i = self.start_seed(seed, language, name)
+        self.number = max(self.number, len(bonuses))
+
+        # add raw value of each stat
+        for stat, bonus in bonuses:
+            if stat not in self.result.stats:
+                logging.debug(f"     > {stat} > {bonus} > {transform_value(stat, bonus)}")  # to see how the value looks
+
+            self.result.stat(stat)[i] = bonus  # raw value, transformed for the entire column afterwards
+
+        self.end_seed(seed)
+
+    # set the raw value of each stat straight in its column, found by the stat enum value without looking up its name
+    def add_raw(self, seed: int, language: str, raw: tuple, stat_names: numpy.ndarray):
+        name, stat_bonuses = raw
+        i = self.start_seed(seed, language, name)
+        self.number = max(self.number, len(stat_bonuses))
+
+        if self.columns_by_stat is None:
+            self.columns_by_stat = [None] * len(stat_names)
+        for stat, bonus, _ in stat_bonuses.tolist():  # fields in the order of STATS_BONUS_DTYPE
+            column = self.columns_by_stat[stat]
+            if column is None:
+                if stat_names[stat] not in self.result.stats:
+                    logging.debug(f"     > {stat_names[stat]} > {bonus} > {transform_value(stat_names[stat], bonus)}")  # to see how the value looks
+                column = self.columns_by_stat[stat] = self.result.stat(stat_names[stat])
+
+            column[i] = bonus  # raw value, transformed for the entire column afterwards
+
+        self.end_seed(seed)
+
+    # add in-game like value of each stat and track its min/max
+    def finish_block(self):
+        start = time.perf_counter()
+        for stat, column in self.result.stat_columns().items():
+            column[:] = transform_column(stat, column)
+
+            present = column[~numpy.isnan(column)]
+            if not len(present):  # stat only occurs in a previous block
+                continue
+
+            low, high = float(present.min()), float(present.max())
+            self.limits[stat] = [min(self.limits[stat][0], low), max(self.limits[stat][1], high)] if stat in self.limits else [low, high]
+
+        self.timer.add("transform", start)
+
+    def meta(self) -> dict:
+        return calculate_meta(self.limits)
+
+    def perfection(self, meta: dict, columns: dict[str, numpy.ndarray]) -> numpy.ndarray:
+        return calculate_perfection(meta, columns, self.number)
+
+    # min, max, range, and weight of each stat and the maximum number of stats per seed
+    def metadata(self, meta: dict) -> dict[str, str]:
+        return {**super().metadata(meta), "pi.meta": json.dumps(meta), "pi.number": str(self.number)}
+
+    def progress(self) -> dict:
+        return {"limits": self.limits, "number": self.number}
+
+
+# endregion
+
+# region Cache
+
+
+# compact raw output of the game for each seed of an item to be able to rebuild all files offline
+class RawCache(object):
+    def __init__(self, f_name: str, language: str, metadata: dict):
+        self.f_name = f_name
+        self.language = language
+        self.metadata = metadata  # stored as JSON in the Parquet metadata, e.g. the game version
+        self.names = []
+        self.seeds = array("i")
+
+        self._unique_names = {}  # procedural names repeat a lot, so keep only one instance of each
+
+    def add_seed(self, seed: int, name: str):
+        self.seeds.append(seed)
+        self.names.append(self._unique_names.setdefault(name, name))
+
+    def columns(self) -> dict[str, pa.Array]:
+        raise NotImplementedError
+
+    def write(self):
+        columns = {"Seed": pa.array(numpy.frombuffer(self.seeds, dtype=numpy.int32))}
+        columns.update(self.columns())
+        columns[self.language] = pa.array(self.names, type=pa.string())
+
+        # keep names of other languages captured before for the same seeds
+        if os.path.isfile(f"{self.f_name}.parquet"):
+            existing = pq.read_table(f"{self.f_name}.parquet")
+            if numpy.array_equal(existing.column("Seed").to_numpy(), columns["Seed"].to_numpy()):
+                for name in existing.column_names:
+                    if name.startswith("Name (") and name not in columns:
+                        columns[name] = existing.column(name)
+
+        os.makedirs(os.path.dirname(self.f_name), exist_ok=True)
+        table = pa.Table.from_arrays(list(columns.values()), names=list(columns.keys()))
+        table = table.replace_schema_metadata({key: json.dumps(value) for key, value in self.metadata.items()})
+        pq.write_table(table, f"{self.f_name}.parquet", compression="zstd")
+
+
+class ProductCache(RawCache):
+    def __init__(self, f_name: str, language: str, metadata: dict):
+        super().__init__(f_name, language, metadata)
+        self.age = array("i")
+        self.value = array("i")
+
+    def add(self, seed: int, name: str, age: int, value: int):
+        self.add_seed(seed, name)
+        self.age.append(age)
+        self.value.append(value)
+
+    def columns(self) -> dict[str, pa.Array]:
+        return {
+            "Age": pa.array(numpy.frombuffer(self.age, dtype=numpy.int32)),
+            "Value": pa.array(numpy.frombuffer(self.value, dtype=numpy.int32)),
+        }
+
+
+# stats of each seed as lists of the stat enum value, the float32 bonus, and the level
+class TechnologyCache(RawCache):
+    def __init__(self, f_name: str, language: str, metadata: dict, stat_names: numpy.ndarray):
+        super().__init__(f_name, language, {**metadata, "stats": {value: name for value, name in enumerate(stat_names) if not name.startswith("Unknown_")}})
+        self.bonus = array("f")
+        self.level = array("i")
+        self.offsets = array("i", [0])
+        self.stat = array("h")
+
+    def add(self, seed: int, name: str, stat_bonuses: numpy.ndarray):
+        self.add_seed(seed, name)
+        self.stat.frombytes(stat_bonuses["Stat"].astype(numpy.int16).tobytes())
+        self.bonus.frombytes(stat_bonuses["Bonus"].tobytes())
+        self.level.frombytes(stat_bonuses["Level"].tobytes())
+        self.offsets.append(len(self.stat))
+
+    def columns(self) -> dict[str, pa.Array]:
+        offsets = pa.array(numpy.frombuffer(self.offsets, dtype=numpy.int32))
+        return {
+            "Stat": pa.ListArray.from_arrays(offsets, pa.array(numpy.frombuffer(self.stat, dtype=numpy.int16))),
+            "Bonus": pa.ListArray.from_arrays(offsets, pa.array(numpy.frombuffer(self.bonus, dtype=numpy.float32))),
+            "Level": pa.ListArray.from_arrays(offsets, pa.array(numpy.frombuffer(self.level, dtype=numpy.int32))),
+        }
+
+
+def read_cache(f_name: str) -> tuple[pa.Table, dict]:
+    table = pq.read_table(f"{f_name}.parquet")
+    return table, {key.decode(): json.loads(value) for key, value in table.schema.metadata.items()}
+
+
+# previous translations of an item updated with all languages in its cache
+def get_cache_languages(f_name: str, cache: pa.Table) -> dict:
+    result = extract_previous_languages(read_existing_file(f_name))
+    for language in LANGUAGES:
+        if language in cache.column_names:
+            result[language] = cache.column(language).fill_null("")
+
+    return result
+
+
+# endregion
+
+# region Backend
+
+
+# raised by the pipeline if the backend reports an item as not available, so other errors are not mistaken for it
+class ItemUnavailableError(Exception):
+    pass
+
+
+# reusable null-terminated ITEM#SEED key to not create a new string and bytes object for each seed. the precomputed digits
+# of a seed are copied into the buffer of the item, which the game gets as the c_char_p its function is declared with
+class SeedKey(object):
+    _digits = None  # zero-padded and null-terminated digits of all seeds
+
+    def __init__(self, item_name: str):
+        if SeedKey._digits is None or len(SeedKey._digits) < TOTAL_SEEDS:
+            SeedKey._digits = [b"%05d\0" % seed for seed in range(TOTAL_SEEDS)]
+
+        prefix = f"{item_name}#".encode("utf-8")
+        self.buffer = ctypes.create_string_buffer(len(prefix) + len(SeedKey._digits[-1]))
+        self.buffer[:len(prefix)] = prefix
+        self.pointer = ctypes.c_char_p(ctypes.addressof(self.buffer))
+        self._start = len(prefix)
+        self._view = memoryview(self.buffer).cast("B")  # writes into the buffer without a call into ctypes
+
+    def set(self, seed: int) -> ctypes.c_char_p:
+        digits = SeedKey._digits[seed]
+        self._view[self._start:self._start + len(digits)] = digits
+        return self.pointer
+
+
+# objects created in the loop are freed by reference counting, so the cyclic garbage collector only costs time there
+@contextmanager
+def gc_paused():
+    enabled = gc.isenabled()
+    gc.freeze()  # everything created so far is not checked again by the next collections
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+        gc.unfreeze()
+
+
+# source of the raw values of each seed. in-game this is the reality manager, offline a synthetic or a replayed one.
+# both methods raise ValueError if the item is not available, like map_struct does in-game
+class Backend(object):
+    hot_loop: bool = False  # generate with bound callables and a paused garbage collector, see bind()
+    stat_names: numpy.ndarray = None  # name of each stat enum value, see stat_names_array()
+    timer: PhaseTimer = None  # of the item currently generated, for backends that time the phases of the game themselves
+
+    # function to get the values of each seed of an item with the method of the same name as kind
+    def bind(self, kind: str, item_name: str) -> Callable[[int], tuple]:
+        return partial(getattr(self, kind), item_name)
+
+    # name, age, and value of a product
+    def product(self, item_name: str, seed: int) -> tuple[str, int, int]:
+        raise NotImplementedError
+
+    # name and the stats of a technology with STATS_BONUS_DTYPE. it must be a copy as the game reuses its memory
+    def technology(self, item_name: str, seed: int) -> tuple[str, numpy.ndarray]:
+        raise NotImplementedError
+
+
+# deterministic random values that look like the real ones to measure the Python side without the game
+class SyntheticBackend(Backend):
+    WORDS = ["Ancient", "Bright", "Crystal", "Dusty", "Echo", "Fossil", "Glowing", "Hollow", "Iron", "Jagged", "Kinetic", "Lost", "Mirror", "Null", "Opal", "Pulse"]
+
+    def __init__(self, stats_per_item: int = 6):
+        self.stat_names = stat_names_array(dict(enumerate(TRANSFORM.keys(), start=1)))
+        self.stats_per_item = stats_per_item  # number of different stats an item can have
+
+        self._stats = {}  # possible stats of each item
+
+    def product(self, item_name: str, seed: int) -> tuple[str, int, int]:
+        rng = random.Random(f"{item_name}#{seed:05}")
+        return f"{rng.choice(self.WORDS)} {rng.choice(self.WORDS)}", rng.randint(10, 500), rng.randint(1000, 200000)
+
+    def technology(self, item_name: str, seed: int) -> tuple[str, numpy.ndarray]:
+        stats = self._stats.get(item_name)
+        if stats is None:
+            stats = self._stats[item_name] = random.Random(item_name).sample(range(1, len(self.stat_names)), self.stats_per_item)
+
+        rng = random.Random(f"{item_name}#{seed:05}")
+        name = f"{rng.choice(self.WORDS)} {rng.choice(self.WORDS)}"
+
+        return name, numpy.array([(stat, rng.uniform(0.5, 2.0), rng.randint(1, 3)) for stat in rng.sample(stats, rng.randint(1, 4))], dtype=STATS_BONUS_DTYPE)
+
+
+# replay the raw output captured in-game for a game version
+class CacheBackend(Backend):
+    def __init__(self, version: str, language: str = None):
+        self.language = language  # names are only returned for this language
+        self.version = version
+
+        self._cache = None
+        self._item_name = None
+        self._rows = None
+
+    def load(self, item_name: str) -> pa.Table:
+        if item_name != self._item_name:
+            f_names = glob.glob(os.path.join(CACHE_ROOT, self.version, "*", f"{item_name}.parquet"))
+            if not f_names:
+                raise ValueError(f"{item_name} is not in the cache of {self.version}")
+
+            self._cache, metadata = read_cache(os.path.splitext(f_names[0])[0])
+            self._item_name = item_name
+            self._rows = None
+            self.stat_names = stat_names_array({int(key): value for key, value in metadata.get("stats", {"0": "Unspecified"}).items()})
+
+        return self._cache
+
+    def names(self, cache: pa.Table) -> list[str]:
+        return cache.column(self.language).fill_null("").to_pylist() if self.language in cache.column_names else [""] * len(cache)
+
+    # values of a seed, all rows of an item are converted at once
+    def row(self, item_name: str, seed: int, convert) -> tuple:
+        cache = self.load(item_name)
+        if self._rows is None:
+            self._rows = convert(cache)
+
+        if seed >= len(self._rows):
+            raise ValueError(f"{item_name} has only {len(self._rows)} seeds in the cache of {self.version}")
+
+        return self._rows[seed]
+
+    def product(self, item_name: str, seed: int) -> tuple[str, int, int]:
+        return self.row(item_name, seed, lambda cache: list(zip(self.names(cache), cache.column("Age").to_pylist(), cache.column("Value").to_pylist())))
+
+    def technology(self, item_name: str, seed: int) -> tuple[str, numpy.ndarray]:
+        return self.row(item_name, seed, self.technology_rows)
+
+    # stats of all seeds in one array and each row gets a view of its own
+    def technology_rows(self, cache: pa.Table) -> list[tuple]:
+        columns = {name: cache.column(name).combine_chunks() for name in STATS_BONUS_DTYPE.names}
+        offsets = columns["Stat"].offsets.to_numpy()
+        offsets = offsets - offsets[0]
+
+        stat_bonuses = numpy.empty(offsets[-1], dtype=STATS_BONUS_DTYPE)
+        for name, column in columns.items():
+            stat_bonuses[name] = column.flatten().to_numpy()
+
+        return [(name, stat_bonuses[offsets[i]:offsets[i + 1]]) for i, name in enumerate(self.names(cache))]
+
+
+# everything to generate an item. all but the name are only used by the consumer of a pipeline
+@dataclass
+class ItemJob:
+    item_name: str
+    language: str  # name of column to write the name in, None to keep the previous names
+    builder: ItemBuilder
+    cache: RawCache = None
+    finished: Callable = None  # called with the job after it is written or given up
+    start_time: datetime = field(default_factory=datetime.now)
+    status: str = None  # finished, unavailable, cancelled, or failed
+
+    def add(self, seed: int, raw: tuple, stat_names: numpy.ndarray):
+        self.builder.add_raw(seed, self.language, raw, stat_names)
+        if self.cache:
+            self.cache.add(seed, *raw)
+
+    # available is None if the generation was cancelled before the item was complete
+    def finish(self, available: bool):
+        if self.status is None:
+            if available:
+                self.builder.write()
+                if self.cache:
+                    self.cache.write()
+                self.status = "finished"
+            elif available is None:
+                self.builder.close()
+                self.status = "cancelled"
+            else:
+                self.builder.discard()
+                self.status = "unavailable"
+
+    # call back once the item is written or given up. errors are only logged, so they cannot stop the caller
+    def notify(self):
+        if self.finished:
+            try:
+                self.finished(self)
+            except Exception as e:
+                logging.exception(e)
+
+
+# generate all remaining seeds of an item in the current thread. returns False if it is not available
+def generate_item(backend: Backend, job: ItemJob) -> bool:
+    backend.timer = job.builder.timer
+    generate = backend.bind(job.builder.kind, job.item_name)
+    for seed in range(job.builder.offset, TOTAL_SEEDS):
+        try:
+            raw = generate(seed)
+        except ValueError:
+            job.finish(False)
+            job.notify()
+            return False
+
+        nested, start = job.builder.timer.nested(), time.perf_counter()
+        job.add(seed, raw, backend.stat_names)
+        job.builder.timer.add("row", start, nested)
+        job.builder.timer.seeds += 1
+
+    job.builder.timer.sample_memory()
+    job.finish(True)
+    job.notify()
+    return True
+
+
+# runs a generation in a background thread that can be paused, resumed, and cancelled between two batches of seeds
+class JobManager(object):
+    def __init__(self):
+        self.cancelled = threading.Event()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.unpaused = threading.Event()
+
+        self._reset()
+
+    def _reset(self):
+        self.cancelled.clear()
+        self.unpaused.set()
+
+        self.cost_done = 0.0
+        self.costs = {}  # item name to expected seconds of the remaining items
+        self.items_done = 0
+        self.items_total = 0
+        self.paused_seconds = 0.0
+        self.paused_start = None
+        self.seeds = 0
+        self.start_time = None
+        self.end_time = None  # once the generating thread has finished or was cancelled
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, target: Callable) -> bool:
+        if self.running:
+            return False
+
+        self._reset()
+        self.start_time = time.perf_counter()
+        self.thread = threading.Thread(target=self._run, args=(target,), name="Pi_Generator", daemon=True)
+        self.thread.start()
+
+        return True
+
+    def _run(self, target: Callable):
+        try:
+            target()
+        finally:
+            self.end_time = time.perf_counter()
+
+    def pause(self):
+        if self.running and self.unpaused.is_set():
+            self.paused_start = time.perf_counter()
+            self.unpaused.clear()
+
+    def resume(self):
+        if not self.unpaused.is_set():
+            self.paused_seconds += time.perf_counter() - self.paused_start
+            self.paused_start = None
+            self.unpaused.set()
+
+    def cancel(self):
+        if self.running:
+            self.cancelled.set()
+            self.resume()  # to let a paused generation notice it
+
+    # called by the generating thread after each batch. blocks while paused and returns False once cancelled
+    def proceed(self, seeds: int = 0) -> bool:
+        self.lock.acquire()
+        try:
+            self.seeds += seeds
+        finally:
+            self.lock.release()
+
+        self.unpaused.wait()
+        return not self.cancelled.is_set()
+
+    # expected seconds of each item as estimated by the cost model
+    def add_items(self, costs: dict[str, float]):
+        self.costs.update(costs)
+        self.items_total += len(costs)
+
+    def item_done(self, item_name: str):
+        self.lock.acquire()
+        try:
+            self.cost_done += self.costs.pop(item_name, 0.0)
+            self.items_done += 1
+        finally:
+            self.lock.release()
+
+    # seconds the generation was actually running
+    def elapsed(self) -> float:
+        if self.start_time is None:
+            return 0.0
+
+        now = self.end_time or time.perf_counter()
+        paused = self.paused_seconds + (now - self.paused_start if self.paused_start is not None else 0.0)
+        return now - self.start_time - paused
+
+    def progress(self) -> str:
+        if self.start_time is None:
+            return "Idle"
+
+        if self.running:
+            state = "Cancelling" if self.cancelled.is_set() else "Paused" if not self.unpaused.is_set() else "Running"
+        else:
+            state = "Cancelled" if self.cancelled.is_set() else "Finished"
+
+        elapsed = self.elapsed()
+        rate = self.seeds / elapsed if elapsed else 0.0
+        # expected seconds of the remaining items, scaled by how the finished ones compare to their estimate
+        remaining = sum(self.costs.values())
+        if self.cost_done:
+            remaining *= elapsed / self.cost_done
+        eta = timedelta(seconds=round(remaining)) if self.running else "?"
+
+        return f"{state}: {self.items_done}/{self.items_total} items, {rate:,.0f} seeds/s, ETA {eta}"
+
+
+@dataclass
+class FrameTask:
+    generate: Callable[[int], tuple]
+    seeds: Iterator[int]
+    measure: Callable = nullcontext  # e.g. to profile the calls on the game's thread
+    done: threading.Event = field(default_factory=threading.Event)
+    error: Exception = None
+    result: list = field(default_factory=list)
+
+
+# runs the calls into the game on its own thread, as many as fit into a time budget per frame. tick() has to be called once per frame by a hook
+class FrameScheduler(object):
+    def __init__(self, budget: float = 0.008, idle_budget: float = 0.1, idle_frame: float = 0.004):
+        self.budget = budget  # seconds per frame
+        self.current_budget = budget
+        self.idle_budget = idle_budget  # maximum the budget grows to while the game itself has little to do, e.g. in the menu
+        self.idle_frame = idle_frame  # the game counts as idle if the time between two ticks is shorter
+        self.last_tick_end = None
+        self.task = None
+        self.tasks = queue.Queue()
+
+    # called from the generating thread, blocks until the values of all seeds are generated on the game's thread
+    def run(self, generate: Callable[[int], tuple], seeds: range, measure: Callable = nullcontext) -> list:
+        task = FrameTask(generate, iter(seeds), measure)
+        self.tasks.put(task)
+        task.done.wait()
+        if task.error:
+            raise task.error
+
+        return task.result
+
+    def tick(self):
+        start = time.perf_counter()
+        if self.last_tick_end is not None:
+            # grow the budget while the game is idle, otherwise fall back to the configured one right away
+            if start - self.last_tick_end < self.idle_frame:
+                self.current_budget = min(self.current_budget * 1.25, self.idle_budget)
+            else:
+                self.current_budget = self.budget
+        deadline = start + self.current_budget
+
+        try:
+            while True:
+                task = self.task
+                if task is None:
+                    try:
+                        task = self.task = self.tasks.get_nowait()
+                    except queue.Empty:
+                        return
+
+                generate, seeds, append = task.generate, task.seeds, task.result.append
+                finished = True
+                try:
+                    with task.measure():
+                        try:
+                            for seed in seeds:
+                                append((seed, generate(seed)))
+                                if time.perf_counter() >= deadline:
+                                    finished = False
+                                    break
+                        except ValueError as e:
+                            raise ItemUnavailableError(str(e)) from e
+                except Exception as e:
+                    task.error = e
+
+                if not finished:
+                    return  # budget used up
+
+                self.task = None
+                task.done.set()
+        finally:
+            self.last_tick_end = time.perf_counter()
+
+
+# calls the backend only in the thread that generates an item and processes the raw values in a separate one.
+# this way the next item is already generated while the previous one is still written
+class Pipeline(object):
+    def __init__(self, backend: Backend, batch_size: int = PIPELINE_BATCH_SIZE, queue_size: int = PIPELINE_QUEUE_SIZE, profiler: RunProfiler = None, jobs: JobManager = None, scheduler: FrameScheduler = None):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.jobs = jobs  # to pause or cancel between two batches
+        self.profiler = profiler
+        self.queue = queue.Queue(queue_size)  # bounded to keep the memory of pending seeds low
+        self.scheduler = scheduler  # to call the backend on the game's thread instead of the current one
+        self.thread = None
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.consume, name="Pi_Consumer", daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.queue.put(None)
+        self.thread.join()
+
+    def measure(self, job: ItemJob, role: str):
+        return self.profiler.measure(job.item_name, role) if self.profiler else nullcontext()
+
+    # seed and values of each seed, generated by the scheduler if there is one. the calls are measured in the thread they run in.
+    # raises ItemUnavailableError if the backend does not know the item
+    def run(self, generate: Callable[[int], tuple], seeds: range, measure: Callable = nullcontext) -> list[tuple]:
+        if self.scheduler:
+            return self.scheduler.run(generate, seeds, measure)
+
+        with measure():
+            try:
+                return [(seed, generate(seed)) for seed in seeds]
+            except ValueError as e:
+                raise ItemUnavailableError(str(e)) from e
+
+    # producer, calls the backend for all remaining seeds of an item and queues them in batches
+    def generate(self, job: ItemJob) -> bool:
+        self.backend.timer = job.builder.timer
+        generate = self.backend.bind(job.builder.kind, job.item_name)
+
+        with gc_paused() if self.backend.hot_loop else nullcontext():
+            for start in range(job.builder.offset, TOTAL_SEEDS, self.batch_size):
+                seeds = range(start, min(start + self.batch_size, TOTAL_SEEDS))
+                try:
+                    batch = self.run(generate, seeds, partial(self.measure, job, "producer"))
+                except ItemUnavailableError:
+                    self.queue.put((job, None, False))
+                    return False
+
+                self.queue.put((job, batch, None))
+                if self.jobs and not self.jobs.proceed(len(batch)) and seeds.stop < TOTAL_SEEDS:
+                    self.queue.put((job, None, None))
+                    return False
+
+        self.queue.put((job, None, True))
+
+        return True
+
+    # consumer, processes the batches in order and finishes each item after its last one
+    def consume(self):
+        while (message := self.queue.get()) is not None:
+            job, batch, available = message
+            try:
+                if batch is None:
+                    job.builder.timer.sample_memory()
+                    with self.measure(job, "consumer"):
+                        job.finish(available)
+                elif job.status is None:
+                    with self.measure(job, "consumer"):
+                        nested, start = job.builder.timer.nested(), time.perf_counter()
+                        for seed, raw in batch:
+                            job.add(seed, raw, self.backend.stat_names)
+                        job.builder.timer.add("row", start, nested)
+                    job.builder.timer.seeds += len(batch)
+                    job.builder.timer.sample_memory()
+            except Exception as e:
+                logging.exception(e)
+                job.status = "failed"  # remaining batches of the item are skipped
+
+            if batch is None:
+                job.notify()
+
+            if batch is None and self.profiler:
+                try:
+                    self.profiler.dump(job.item_name)
+                except Exception as e:
+                    logging.exception(e)
+
+
+# rebuild the files of an item from its cache. names of the cached languages replace the previous ones
+def rebuild(version: str, inventory_type: str, item_name: str, block_size: int = 0, storage: StorageProfile = STORAGE_PROFILES["default"]) -> bool:
+    backend = CacheBackend(version)
+    cache = backend.load(item_name)
+
+    f_name = item_path(inventory_type, item_name)
+    builder_class = ProductBuilder if inventory_type == "Product" else TechnologyBuilder
+    builder = builder_class(f_name, block_size, previous_languages=get_cache_languages(f_name, cache))
+    builder.storage = storage
+    builder.version = version
+
+    return generate_item(backend, ItemJob(item_name, None, builder))
+
+
+# endregion
@@ -0,0 +1,50 @@
+import argparse
+import glob
+import logging
+import os
+
+from datetime import datetime
+
+from pi_engine import CACHE_ROOT, STORAGE_PROFILES, TOTAL_SEEDS, StorageProfile, get_storage, rebuild
+
+
+# rebuild the CSV and Parquet files of all cached items of a game version without running the game
+def rebuild_version(version: str, items: list, streaming_seeds: int, storage: StorageProfile) -> None:
+    start_time = datetime.now()
+
+    for cache_f_name in sorted(glob.glob(os.path.join(CACHE_ROOT, version, "*", "*.parquet"))):
+        inventory_type = os.path.basename(os.path.dirname(cache_f_name))
+        item_name = os.path.splitext(os.path.basename(cache_f_name))[0]
+        if items and not any((key.upper() in items) for key in [inventory_type, item_name]):
+            continue
+
+        item_start_time = datetime.now()
+        if rebuild(version, inventory_type, item_name, streaming_seeds, storage):
+            logging.info(f"   > {item_name} > {datetime.now() - item_start_time}")
+        else:
+            logging.warning(f"  ! {item_name} > Cache is incomplete.")
+
+    logging.info(f">> Pi: Rebuild for {version} finished in {datetime.now() - start_time}!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuilds the files of all items from the raw output captured in-game.")
+
+    parser.add_argument("version", choices=sorted(os.listdir(CACHE_ROOT)) if os.path.isdir(CACHE_ROOT) else None, help="Game version of the cache to use.")
+    parser.add_argument("-d", "--debug", action="store_true", help="Enable debug mode.")
+    parser.add_argument("-i", "--items", nargs="*", default=[], help="Only rebuild these inventory types or items.")
+    parser.add_argument("--storage", choices=STORAGE_PROFILES.keys(), default="default", help="Storage profile of the Parquet files.")
+    parser.add_argument("--sort-by-perfection", action="store_true", help="Write the Parquet files with the best seeds first.")
+    parser.add_argument("--sidecar-names", action="store_true", help="Write the names of each language to their own Parquet file.")
+    parser.add_argument("-s", "--streaming-seeds", type=int, default=0, help="Number of seeds per row group (0 = all at once).")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(format="%(message)s", level=logging.DEBUG if args.debug else logging.INFO)
+
+    # sorting by perfection would hold each item in memory, which is what streaming avoids
+    if args.sort_by_perfection and 0 < args.streaming_seeds < TOTAL_SEEDS:
+        logging.warning(">> Pi: --sort-by-perfection is ignored with --streaming-seeds as it would hold each item in memory.")
+        args.sort_by_perfection = False
+
+    rebuild_version(args.version, [item.upper() for item in args.items], args.streaming_seeds, get_storage(args.storage, args.sort_by_perfection, args.sidecar_names))